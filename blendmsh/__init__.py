@@ -8,23 +8,47 @@ bl_info = {
     "category": "Mesh",
 }
 
-import bpy
-
-from .properties import BlendmshProperties
-from .panel import BLENDMSH_PT_Panel
-from .processor import BLENDMSH_OT_Meshinit, BLENDMSH_OT_Meshproc, BLENDMSH_OT_Physicalgroups
-from .preferences import BlendmshPreferences
-
-classes = (
-    BlendmshPreferences,
-    BlendmshProperties,
-    BLENDMSH_PT_Panel,
-    BLENDMSH_OT_Meshinit,
-    BLENDMSH_OT_Meshproc,
-    BLENDMSH_OT_Physicalgroups,
-)
+try:
+    import bpy
+except ImportError:
+    # Worker processes import the bpy-free meshing modules outside of Blender
+    bpy = None
+
+if bpy is not None:
+    import time
+    _import_start = time.perf_counter()
+
+    from . import cache, jobs, loader
+    from .properties import BlendmshProperties
+    from .panel import BLENDMSH_PT_Panel
+    from .processor import (
+        BLENDMSH_OT_Meshinit, BLENDMSH_OT_Meshproc, BLENDMSH_OT_Meshbatch, BLENDMSH_OT_Meshcancel,
+        BLENDMSH_OT_Physicalgroups,
+    )
+    from .preferences import BlendmshPreferences
+
+    classes = (
+        BlendmshPreferences,
+        BlendmshProperties,
+        BLENDMSH_PT_Panel,
+        BLENDMSH_OT_Meshinit,
+        BLENDMSH_OT_Meshproc,
+        BLENDMSH_OT_Meshbatch,
+        BLENDMSH_OT_Meshcancel,
+        BLENDMSH_OT_Physicalgroups,
+    )
+
+    loader.timings['import'] = time.perf_counter() - _import_start
+
+def _warm_up():
+    # Runs once from a timer after startup, so enabling the add-on stays cheap
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is not None and addon.preferences.warm_up:
+        loader.warm_up()
+    return None
 
 def register():
+    start = time.perf_counter()
     try:
         for cls in classes:
             bpy.utils.register_class(cls)
@@ -32,12 +56,23 @@ def register():
         # Register custom property to Scene
         bpy.types.Scene.blendmsh = bpy.props.PointerProperty(type=BlendmshProperties)
 
+        cache.register()
+
+        bpy.app.timers.register(_warm_up, first_interval=1.0, persistent=True)
+        loader.timings['register'] = time.perf_counter() - start
+
     except Exception as e:
         print(f"Error during registration: {e}")
         unregister()  # Clean up if registration fails
 
 def unregister():
     try:
+        if bpy.app.timers.is_registered(_warm_up):
+            bpy.app.timers.unregister(_warm_up)
+        if jobs.current is not None:
+            jobs.current.cancel()
+        cache.unregister()
+
         # Unregister in reverse order to avoid dependency issues
         del bpy.types.Scene.blendmsh
         for cls in reversed(classes):
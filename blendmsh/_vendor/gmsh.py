@@ -28,6 +28,7 @@ from ctypes import *
 from ctypes.util import find_library
 import signal
 import os
+import sys
 import platform
 from math import pi
 
@@ -102,6 +103,14 @@ if try_numpy:
 
 prev_interrupt_handler = None
 
+# Input copy accounting, not part of the Gmsh Python API. Set copy_stats to a
+# dict to record, per API function, the bytes copied while marshalling input
+# vectors, split into conversions from Python sequences and dtype casts (or
+# non-contiguous copies) of numpy arrays. Set copy_strict_size to a number of
+# bytes to raise whenever an input at least that large has to be copied.
+copy_stats = None
+copy_strict_size = None
+
 # Utility functions, not part of the Gmsh Python API
 
 def _ostring(s):
@@ -110,8 +119,15 @@ def _ostring(s):
     return sp
 
 def _ovectorpair(ptr, size):
-    v = list((ptr[i * 2], ptr[i * 2 + 1]) for i in range(size//2))
-    lib.gmshFree(ptr)
+    if use_numpy:
+        if size == 0 :
+            lib.gmshFree(ptr)
+            return numpy.ndarray((0,2),numpy.int32)
+        v = numpy.ctypeslib.as_array(ptr, (size//2, 2))
+        weakreffinalize(v, lib.gmshFree, ptr)
+    else:
+        v = list((ptr[i * 2], ptr[i * 2 + 1]) for i in range(size//2))
+        lib.gmshFree(ptr)
     return v
 
 def _ovectorint(ptr, size):
@@ -179,15 +195,41 @@ def _ovectorvectorpair(ptr, size, n):
     lib.gmshFree(ptr)
     return v
 
+def _icopy(o, array, nbytes):
+    # o was converted to array for the C API: record it if a copy was made
+    if nbytes == 0:
+        return
+    if use_numpy and isinstance(o, numpy.ndarray):
+        if numpy.may_share_memory(o, array):
+            return
+        kind = 'casts'
+    else:
+        kind = 'lists'
+    frame = sys._getframe(1)
+    while frame.f_code.co_name.startswith(('_i', '<')):
+        frame = frame.f_back
+    code = frame.f_code
+    name = getattr(code, 'co_qualname', code.co_name)
+    if copy_strict_size is not None and nbytes >= copy_strict_size:
+        raise Exception("Input of {} bytes copied in {} ({})".format(nbytes, name, kind))
+    if copy_stats is not None:
+        entry = copy_stats.setdefault(name, {'bytes': 0, 'lists': 0, 'casts': 0})
+        entry['bytes'] += nbytes
+        entry[kind] += 1
+
 def _ivectorint(o):
     if use_numpy:
         array = numpy.ascontiguousarray(o, numpy.int32)
         if(len(o) and array.ndim != 1):
             raise Exception("Invalid data for input vector of integers")
+        if copy_stats is not None or copy_strict_size is not None:
+            _icopy(o, array, array.nbytes)
         ct = array.ctypes
         ct.array = array
         return ct, c_size_t(len(o))
     else:
+        if copy_stats is not None or copy_strict_size is not None:
+            _icopy(o, None, len(o) * sizeof(c_int))
         return (c_int * len(o))(*o), c_size_t(len(o))
 
 def _ivectorsize(o):
@@ -195,10 +237,14 @@ def _ivectorsize(o):
         array = numpy.ascontiguousarray(o, numpy.uintp)
         if(len(o) and array.ndim != 1):
             raise Exception("Invalid data for input vector of sizes")
+        if copy_stats is not None or copy_strict_size is not None:
+            _icopy(o, array, array.nbytes)
         ct = array.ctypes
         ct.array = array
         return ct, c_size_t(len(o))
     else:
+        if copy_stats is not None or copy_strict_size is not None:
+            _icopy(o, None, len(o) * sizeof(c_size_t))
         return (c_size_t * len(o))(*o), c_size_t(len(o))
 
 def _ivectordouble(o):
@@ -206,10 +252,14 @@ def _ivectordouble(o):
         array = numpy.ascontiguousarray(o, numpy.float64)
         if(len(o) and array.ndim != 1):
             raise Exception("Invalid data for input vector of doubles")
+        if copy_stats is not None or copy_strict_size is not None:
+            _icopy(o, array, array.nbytes)
         ct = array.ctypes
         ct.array = array
         return  ct, c_size_t(len(o))
     else:
+        if copy_stats is not None or copy_strict_size is not None:
+            _icopy(o, None, len(o) * sizeof(c_double))
         return (c_double * len(o))(*o), c_size_t(len(o))
 
 def _ivectorpair(o):
@@ -217,12 +267,16 @@ def _ivectorpair(o):
         array = numpy.ascontiguousarray(o, numpy.int32)
         if(len(o) and (array.ndim != 2 or array.shape[1] != 2)):
             raise Exception("Invalid data for input vector of pairs")
+        if copy_stats is not None or copy_strict_size is not None:
+            _icopy(o, array, array.nbytes)
         ct = array.ctypes
         ct.array = array
         return ct, c_size_t(len(o) * 2)
     else:
         if(len(o) and len(o[0]) != 2):
             raise Exception("Invalid data for input vector of pairs")
+        if copy_stats is not None or copy_strict_size is not None:
+            _icopy(o, None, len(o) * sizeof(c_int) * 2)
         return ((c_int * 2) * len(o))(*o), c_size_t(len(o) * 2)
 
 def _ivectorstring(o):
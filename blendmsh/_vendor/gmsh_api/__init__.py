@@ -4,73 +4,420 @@ __credits__ = 'Christophe Geuzaine' # you are my hero ;-)
 import logging
 import os
 import numpy as np
-import pandas as pd
-from .... import gmsh_api
-from ....gmsh_api import gmsh as ___vendorize__0
-gmsh_api.gmsh = ___vendorize__0
+
+# legacy type names kept for the DataFrame export
+ELEMENT_NAMES = {
+    2: "shell3",
+    3: "shell4",
+}
+
+# node tags are indexed with a dense lookup table when the largest tag is at
+# most this many times the number of nodes, otherwise with sorted tags
+DENSE_INDEX_FACTOR = 4
+
+# corner nodes of the faces (3D), edges (2D) or end points (1D) of each element
+# family, in gmsh local node numbering; higher order types share the corners
+ELEMENT_FACES = {
+    "Line": ((0,), (1,)),
+    "Triangle": ((0, 1), (1, 2), (2, 0)),
+    "Quadrilateral": ((0, 1), (1, 2), (2, 3), (3, 0)),
+    "Tetrahedron": ((0, 1, 2), (0, 1, 3), (0, 2, 3), (1, 2, 3)),
+    "Hexahedron": ((0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)),
+    "Prism": ((0, 1, 2), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)),
+    "Pyramid": ((0, 1, 2, 3), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4)),
+}
+
+# element type -> (name, dim, order, nodes per element), filled once per type
+_element_properties = {}
+
+
+def element_properties(gmsh, etype):
+    """return the cached (name, dim, order, n_nodes) of a gmsh element type"""
+    etype = int(etype)
+    props = _element_properties.get(etype)
+    if props is None:
+        name, dim, order, n_nodes, _, _ = gmsh.model.mesh.getElementProperties(etype)
+        props = _element_properties[etype] = (name, dim, order, n_nodes)
+    return props
 
 class Mesh():
-    """a mesh container"""
+    """a columnar mesh container
+
+    nodes are stored as `node_tags` (uint64) and `coords` (N x 3 float64),
+    elements as one block per gmsh element type in `element_tags` and
+    `connectivity` (n_elements x nodes per element node tags); `nidxs` holds
+    the same connectivity translated to 0-based rows of `coords`, and
+    `groups` maps physical group names to (dim, element tags)
+
+    the node index, `nidxs` and the adjacency graphs are built on first use
+    and cached, so wrapping memory-mapped arrays does not read them; the
+    caches are dropped whenever one of the topology attributes is reassigned,
+    call `invalidate()` after modifying their arrays in place
+    """
+
+    _TOPOLOGY = ('node_tags', 'element_tags', 'connectivity', 'element_types')
 
-    def __init__(self):
+    def __init__(self, node_tags=None, coords=None, element_tags=None, connectivity=None, element_types=None,
+                 groups=None):
         """create a Mesh instance with nodes and elements"""
 
-        self.elements = pd.DataFrame(columns=['pid', 'elid', 'type', 'n_nodes', 'nodes', 'nidxs'])
-        self.nodes = pd.DataFrame(columns=['nid', 'x', 'y', 'z'])
+        self.node_tags = np.empty(0, dtype=np.uint64) if node_tags is None else node_tags
+        self.coords = np.empty((0, 3), dtype=np.float64) if coords is None else coords
+        self.element_tags = {} if element_tags is None else element_tags
+        self.connectivity = {} if connectivity is None else connectivity
+        # element type -> (name, dim, order, n_nodes)
+        self.element_types = {} if element_types is None else element_types
+        self.groups = {} if groups is None else groups
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in self._TOPOLOGY:
+            self.invalidate()
+
+    def invalidate(self):
+        """drop the cached node index, nidxs and adjacency graphs"""
+
+        object.__setattr__(self, '_indexed', False)
+        object.__setattr__(self, '_nidxs', None)
+        object.__setattr__(self, '_adjacency', {})
+
+    def _index_nodes(self):
+        """build the node tag -> row lookup"""
+
+        tags = self.node_tags
+        self._tag_to_row = None
+        self._sorted_tags = None
+        self._sorted_rows = None
+        max_tag = int(tags.max()) if len(tags) else 0
+        if max_tag <= DENSE_INDEX_FACTOR * len(tags):
+            self._tag_to_row = np.full(max_tag + 1, -1, dtype=np.int64)
+            self._tag_to_row[tags] = np.arange(len(tags))
+        else:
+            order = np.argsort(tags, kind='stable')
+            self._sorted_tags = tags[order]
+            self._sorted_rows = order
+        self._indexed = True
+
+    @property
+    def tag_to_row(self):
+        """dense node tag -> row table, None when the tags are too sparse"""
+
+        if not self._indexed:
+            self._index_nodes()
+        return self._tag_to_row
+
+    @property
+    def nidxs(self):
+        """connectivity per element type as 0-based rows of coords"""
+
+        if self._nidxs is None:
+            self._nidxs = {etype: self.rows(conn) for etype, conn in self.connectivity.items()}
+        return self._nidxs
+
+    def rows(self, tags):
+        """translate node tags (any shape) into 0-based rows of coords"""
+
+        tags = np.asarray(tags, dtype=np.uint64)
+        if self.tag_to_row is not None:
+            found = tags < len(self.tag_to_row)
+            rows = self.tag_to_row[np.where(found, tags, 0)]
+            found &= rows >= 0
+        else:
+            pos = np.searchsorted(self._sorted_tags, tags)
+            np.minimum(pos, len(self._sorted_tags) - 1, out=pos)
+            rows = self._sorted_rows[pos]
+            found = self._sorted_tags[pos] == tags
+        if not found.all():
+            raise KeyError("unknown node tags: {}".format(tags[~found][:10]))
+        return rows
+
+    def _element_blocks(self, dim):
+        """return [(etype, first row, count)] of the element types of `dim`"""
+
+        blocks = []
+        start = 0
+        for etype in sorted(self.connectivity):
+            if self.element_types[etype][1] == dim:
+                count = len(self.connectivity[etype])
+                blocks.append((etype, start, count))
+                start += count
+        return blocks
+
+    def _default_dim(self, dim):
+        if dim is None:
+            dim = max((props[1] for props in self.element_types.values()), default=0)
+        return dim
+
+    def element_row_tags(self, dim=None):
+        """return the element tags of the rows used by the adjacency graphs of `dim`"""
+
+        dim = self._default_dim(dim)
+        tags = [self.element_tags[etype] for etype, _, _ in self._element_blocks(dim)]
+        return np.concatenate(tags) if tags else np.empty(0, dtype=np.uint64)
+
+    @staticmethod
+    def _csr(src, dst, n_rows):
+        """return (indptr, indices) of the edges src -> dst, grouped by src"""
+
+        order = np.argsort(src, kind='stable')
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n_rows), out=indptr[1:])
+        return indptr, np.asarray(dst)[order]
+
+    def node_to_element(self, dim=None):
+        """return the node -> element graph of the elements of `dim` as CSR
+
+        `indices[indptr[i]:indptr[i + 1]]` are the element rows (see
+        `element_row_tags`) that use the node in row `i` of coords; the
+        default dimension is the highest one in the mesh
+        """
+
+        dim = self._default_dim(dim)
+        key = ('node_to_element', dim)
+        if key not in self._adjacency:
+            nodes = []
+            elements = []
+            for etype, start, count in self._element_blocks(dim):
+                nidxs = self.nidxs[etype]
+                nodes.append(nidxs.reshape(-1))
+                elements.append(np.repeat(np.arange(start, start + count), nidxs.shape[1]))
+            nodes = np.concatenate(nodes) if nodes else np.empty(0, dtype=np.int64)
+            elements = np.concatenate(elements) if elements else np.empty(0, dtype=np.int64)
+            self._adjacency[key] = self._csr(nodes, elements, len(self.node_tags))
+        return self._adjacency[key]
+
+    def element_to_element(self, dim=None):
+        """return the face-neighbour element -> element graph of `dim` as CSR
+
+        two elements are neighbours when they share a face (3D), an edge (2D)
+        or an end point (1D), compared on corner nodes only; the graph is
+        built by sorting all face keys once instead of hashing per face, and
+        every pair within a run of equal keys is linked, so elements meeting
+        at a non-manifold edge or a branching point are all neighbours
+        """
+
+        dim = self._default_dim(dim)
+        key = ('element_to_element', dim)
+        if key not in self._adjacency:
+            keys = []
+            owners = []
+            for etype, start, count in self._element_blocks(dim):
+                family = self.element_types[etype][0].split()[0]
+                nidxs = self.nidxs[etype]
+                for face in ELEMENT_FACES.get(family, ()):
+                    face_key = np.full((count, 4), -1, dtype=np.int64)
+                    face_key[:, :len(face)] = np.sort(nidxs[:, list(face)], axis=1)
+                    keys.append(face_key)
+                    owners.append(np.arange(start, start + count))
+            n_rows = sum(count for _, _, count in self._element_blocks(dim))
+            if keys:
+                keys = np.concatenate(keys).view(np.dtype((np.void, 32))).reshape(-1)
+                owners = np.concatenate(owners)
+                order = np.argsort(keys, kind='stable')
+                keys = keys[order]
+                owners = owners[order]
+                # runs of equal face keys, one per distinct face
+                starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+                lengths = np.diff(np.append(starts, len(keys)))
+                run_starts = np.repeat(starts, lengths)
+                run_lengths = np.repeat(lengths, lengths)
+                # pair every position of a shared face with each position of its run
+                shared = np.flatnonzero(run_lengths > 1)
+                counts = run_lengths[shared]
+                first = np.repeat(shared, counts)
+                second = (np.repeat(run_starts[shared], counts)
+                          + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+                other = first != second
+                src = owners[first[other]]
+                dst = owners[second[other]]
+            else:
+                src = dst = np.empty(0, dtype=np.int64)
+            self._adjacency[key] = self._csr(src, dst, n_rows)
+        return self._adjacency[key]
 
     @classmethod
     def from_gmsh(cls, gmsh):
-        """create mesh from gmsh"""
+        """create mesh from gmsh
+
+        every element type returned by getElements is converted, including
+        volume and higher order elements; the arrays are reshaped views of the
+        buffers returned by gmsh, no element or node data is copied
+        """
 
-        elements = [] # pd.DataFrame(columns=['pid', 'elid', 'type', 'n_nodes', 'nodes'])
+        element_tags = {}
+        connectivity = {}
+        element_types = {}
         etypes, elids, enids = gmsh.model.mesh.getElements()
-        typedict = dict(zip(etypes, range(len(etypes))))
-        logging.debug(typedict)
-        # quads
-        idx = typedict.get(3)
-        if idx is not None:
-            quad_nids = elids[idx]
-            quad_nodes = np.array(enids[idx])
-            quad_nodes = quad_nodes.reshape(len(quad_nodes) // 4, 4).tolist()
-            quads = pd.DataFrame()
-            quads["elid"] = quad_nids
-            quads["n_nodes"] = 4
-            quads["nodes"] = quad_nodes
-            quads["nidxs"] = quad_nodes
-            quads["type"] = "shell4"
-            quads["pid"] = 1
-            elements.append(quads)
-        # tria
-        idx = typedict.get(2)
-        if idx is not None:
-            tria_nids = elids[idx]
-            tria_nodes = np.array(enids[idx])
-            tria_nodes = tria_nodes.reshape(len(tria_nodes) // 3, 3).tolist()
-            tria_nodes
-            trias = pd.DataFrame()
-            trias["elid"] = tria_nids
-            trias["n_nodes"] = 3
-            trias["nodes"] = tria_nodes
-            trias["nidxs"] = tria_nodes
-            trias["type"] = "shell3"
-            trias["pid"] = 1
-            elements.append(trias)
+        logging.debug(dict(zip(etypes, range(len(etypes)))))
+        for etype, tags, nodes in zip(etypes, elids, enids):
+            etype = int(etype)
+            props = element_properties(gmsh, etype)
+            element_types[etype] = props
+            element_tags[etype] = np.asarray(tags, dtype=np.uint64)
+            connectivity[etype] = np.asarray(nodes, dtype=np.uint64).reshape(-1, props[3])
 
         nids, coord, parametric_coord = gmsh.model.mesh.getNodes()
-        coord = np.array(coord)
-        coord = coord.reshape(len(coord) // 3, 3)
-        nodes = pd.DataFrame({'nid': nids, 'x': coord[:, 0], 'y': coord[:, 1], 'z': coord[:, 2]})
+        node_tags = np.asarray(nids, dtype=np.uint64)
+        coords = np.asarray(coord, dtype=np.float64).reshape(-1, 3)
+
+        groups = {}
+        for dim, tag in gmsh.model.getPhysicalGroups():
+            name = gmsh.model.getPhysicalName(dim, tag) or "{}:{}".format(dim, tag)
+            tags = [np.asarray(elids, dtype=np.uint64)
+                    for entity in gmsh.model.getEntitiesForPhysicalGroup(dim, tag)
+                    for elids in gmsh.model.mesh.getElements(dim, int(entity))[1]]
+            groups[name] = (int(dim), np.concatenate(tags) if tags else np.empty(0, dtype=np.uint64))
+
+        return cls(node_tags, coords, element_tags, connectivity, element_types, groups)
+
+    @property
+    def n_nodes(self):
+        return len(self.node_tags)
+
+    @property
+    def n_elements(self):
+        return sum(len(tags) for tags in self.element_tags.values())
+
+    def to_dataframes(self):
+        """export (nodes, elements) as pandas DataFrames
+
+        same layout as the former DataFrame based container, pandas is only
+        imported here
+        """
+        import pandas as pd
+
+        nodes = pd.DataFrame({'nid': self.node_tags, 'x': self.coords[:, 0],
+                              'y': self.coords[:, 1], 'z': self.coords[:, 2]})
         nodes.index = nodes.nid.values.copy()
 
-        elements = pd.concat(elements, ignore_index=True)
-        elements.reset_index(inplace=True, drop=True)
+        elements = []
+        for etype, conn in self.connectivity.items():
+            block = pd.DataFrame()
+            block["elid"] = self.element_tags[etype]
+            block["n_nodes"] = conn.shape[1]
+            block["nodes"] = conn.tolist()
+            block["nidxs"] = self.nidxs[etype].tolist()
+            block["type"] = ELEMENT_NAMES.get(etype) or self.element_types.get(etype, (str(etype),))[0]
+            block["pid"] = 1
+            elements.append(block)
+        if elements:
+            elements = pd.concat(elements, ignore_index=True)
+        else:
+            elements = pd.DataFrame(columns=['pid', 'elid', 'type', 'n_nodes', 'nodes', 'nidxs'])
+        return nodes, elements
+
+    def __str__(self):
+        return "(Mesh nodes:{} elements:{})".format(self.n_nodes, self.n_elements)
+
+    __repr__ = __str__
+
+
+class LazyMesh():
+    """a mesh view on a live gmsh model
+
+    nothing is read from gmsh up front; every block (all nodes, one element
+    type, the elements of one entity, the nodes of one physical group) is
+    fetched on first access and cached, so memory scales with what is used
+    """
+
+    def __init__(self, gmsh, model=None):
+        """create a view on `model` (default: the current gmsh model)"""
+
+        self.gmsh = gmsh
+        self.model = gmsh.model.getCurrent() if model is None else model
+        self._blocks = {}
+
+    def _fetch(self, key, loader):
+        """return a cached block, loading it from the viewed model if needed"""
+
+        block = self._blocks.get(key)
+        if block is None:
+            current = self.gmsh.model.getCurrent()
+            if current != self.model:
+                self.gmsh.model.setCurrent(self.model)
+            try:
+                block = self._blocks[key] = loader()
+            finally:
+                if current != self.model:
+                    self.gmsh.model.setCurrent(current)
+        return block
+
+    def _reshape(self, etype, tags, nodes):
+        n_nodes = element_properties(self.gmsh, etype)[3]
+        return (np.asarray(tags, dtype=np.uint64),
+                np.asarray(nodes, dtype=np.uint64).reshape(-1, n_nodes))
+
+    def nodes(self):
+        """return (node_tags, coords) of the whole model"""
+
+        def load():
+            nids, coord, _ = self.gmsh.model.mesh.getNodes()
+            return np.asarray(nids, dtype=np.uint64), np.asarray(coord, dtype=np.float64).reshape(-1, 3)
+        return self._fetch(('nodes',), load)
+
+    def elements_by_type(self, etype, tag=-1):
+        """return (element_tags, connectivity) of one element type, optionally on entity `tag`"""
+
+        def load():
+            tags, nodes = self.gmsh.model.mesh.getElementsByType(etype, tag)
+            return self._reshape(etype, tags, nodes)
+        return self._fetch(('type', int(etype), tag), load)
+
+    def elements(self, dim=-1, tag=-1):
+        """return {element type: (element_tags, connectivity)} of the entity (dim, tag)"""
+
+        def load():
+            etypes, elids, enids = self.gmsh.model.mesh.getElements(dim, tag)
+            return {int(etype): self._reshape(etype, tags, nodes)
+                    for etype, tags, nodes in zip(etypes, elids, enids)}
+        return self._fetch(('entity', dim, tag), load)
+
+    def physical_group_nodes(self, dim, tag):
+        """return (node_tags, coords) of the nodes of a physical group"""
+
+        def load():
+            nids, coord = self.gmsh.model.mesh.getNodesForPhysicalGroup(dim, tag)
+            return np.asarray(nids, dtype=np.uint64), np.asarray(coord, dtype=np.float64).reshape(-1, 3)
+        return self._fetch(('physical nodes', dim, tag), load)
+
+    def physical_group_elements(self, dim, tag):
+        """return {element type: (element_tags, connectivity)} of a physical group"""
+
+        def load():
+            blocks = {}
+            for entity in self.gmsh.model.getEntitiesForPhysicalGroup(dim, tag):
+                for etype, block in self.elements(dim, int(entity)).items():
+                    blocks.setdefault(etype, []).append(block)
+            return {etype: (np.concatenate([b[0] for b in parts]), np.concatenate([b[1] for b in parts]))
+                    for etype, parts in blocks.items()}
+        return self._fetch(('physical elements', dim, tag), load)
+
+    @property
+    def nbytes(self):
+        """bytes held by the cached blocks"""
+
+        def size(block):
+            if isinstance(block, dict):
+                return sum(size(b) for b in block.values())
+            return sum(a.nbytes for a in block)
+        return sum(size(block) for block in self._blocks.values())
+
+    def clear(self):
+        """drop all cached blocks"""
+
+        self._blocks.clear()
+
+    def to_mesh(self):
+        """load everything into a Mesh"""
 
-        self = cls()
-        self.elements = elements
-        self.nodes = nodes
-        return self
+        node_tags, coords = self.nodes()
+        blocks = self.elements()
+        return Mesh(node_tags, coords,
+                    {etype: b[0] for etype, b in blocks.items()},
+                    {etype: b[1] for etype, b in blocks.items()},
+                    {etype: element_properties(self.gmsh, etype) for etype in blocks})
 
     def __str__(self):
-        return "(Mesh nodes:{} elements:{})".format(len(self.elements), len(self.nodes))
+        return "(LazyMesh model:{} blocks:{})".format(self.model, len(self._blocks))
 
-    __repr__ = __str__
\ No newline at end of file
+    __repr__ = __str__
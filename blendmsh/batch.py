@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .jobs import SharedInputs, attached, importable, spawning
+
+
+def _mesh_one(function, args, kwargs):
+    """Pool worker: runs one pipeline function on shared arrays, returns its counts and time."""
+    from . import pipeline, tracing
+
+    start = time.perf_counter()
+    # Pool processes are reused, the inputs are unmapped before the next object
+    with attached(args, kwargs) as (args, kwargs):
+        result = tracing.call(getattr(pipeline, function), *args, **kwargs)
+    return dict(result, time=time.perf_counter() - start)
+
+
+class Batch():
+    """Meshes several objects across a process pool sized to the machine.
+
+    ``tasks`` is a list of ``(name, function, args, kwargs)``, one per object,
+    each calling ``pipeline.<function>`` with its own output file and groups.
+    Array arguments go to the workers through shared memory. Like
+    ``jobs.MeshJob``, the batch is driven by calling ``poll`` periodically.
+    """
+
+    def __init__(self, tasks, max_workers=None):
+        self.tasks = tasks
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.workers = 0
+        # Object name -> counts and time, or the error it failed with
+        self.results = {}
+        self.errors = {}
+        self.finished = False
+        self.cancelled = False
+        self.started = None
+        self.elapsed = 0.0
+        self._executor = None
+        self._futures = {}
+        self._inputs = []
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.workers = min(self.max_workers, len(self.tasks)) or 1
+        self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+        # The pool starts its processes as tasks are submitted
+        with spawning():
+            for name, function, args, kwargs in self.tasks:
+                inputs = SharedInputs(args, kwargs)
+                self._inputs.append(inputs)
+                future = self._executor.submit(importable(_mesh_one), function, inputs.args, inputs.kwargs)
+                self._futures[future] = name
+        return self
+
+    def poll(self):
+        """Collects the objects meshed so far, returns True once all of them are done."""
+        if self.finished:
+            return True
+        self.elapsed = time.perf_counter() - self.started
+        for future in [future for future in self._futures if future.done()]:
+            name = self._futures.pop(future)
+            try:
+                self.results[name] = future.result()
+            except Exception as e:
+                self.errors[name] = str(e)
+        if not self._futures:
+            self._finish()
+        return self.finished
+
+    def cancel(self):
+        """Drops the objects not started yet; objects already meshing run to completion."""
+        if self.finished:
+            return
+        self.cancelled = True
+        for future in self._futures:
+            future.cancel()
+        self._finish()
+
+    @property
+    def stage(self):
+        return f'{len(self.results) + len(self.errors)}/{len(self.tasks)} objects'
+
+    @property
+    def progress(self):
+        return (len(self.results) + len(self.errors)) / max(len(self.tasks), 1)
+
+    def summary(self):
+        """Returns one line per object plus a total, slowest objects first."""
+        lines = [
+            f"{name}: {result['n_nodes']} nodes, {result['n_elements']} elements in {result['time']:.2f}s"
+            for name, result in sorted(self.results.items(), key=lambda item: item[1]['time'], reverse=True)
+        ]
+        lines.extend(f'{name}: failed ({error})' for name, error in self.errors.items())
+        busy = sum(result['time'] for result in self.results.values())
+        lines.append(
+            f'{len(self.results)}/{len(self.tasks)} objects meshed in {self.elapsed:.2f}s '
+            f'({busy:.2f}s of meshing on {self.workers} processes).'
+        )
+        return lines
+
+    def _finish(self):
+        self.finished = True
+        self.elapsed = time.perf_counter() - self.started
+        # Objects still meshing after a cancel keep their mapping of the
+        # inputs, unlinking only removes the names
+        self._executor.shutdown(wait=not self.cancelled, cancel_futures=True)
+        for inputs in self._inputs:
+            inputs.release()
+        self._inputs = []
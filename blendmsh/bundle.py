@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+
+BUNDLE_VERSION = 1
+HEADER_NAME = 'header.json'
+
+
+def bundle_path(output_file):
+    """Returns the bundle directory stored next to a generated mesh file."""
+    return output_file + '.blendmsh'
+
+
+def _write_array(directory, name, array):
+    """Writes an array as a flat raw file and returns its header entry."""
+    array = np.ascontiguousarray(array)
+    filename = name + '.bin'
+    array.tofile(os.path.join(directory, filename))
+    return {'file': filename, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+
+
+def _map_array(directory, entry):
+    """Memory-maps an array described by a header entry, read-only."""
+    shape = tuple(entry['shape'])
+    dtype = np.dtype(entry['dtype'])
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(os.path.join(directory, entry['file']), dtype=dtype, mode='r', shape=shape)
+
+
+def _write_bundle(path, mesh):
+    header = {
+        'version': BUNDLE_VERSION,
+        'node_tags': _write_array(path, 'node_tags', mesh.node_tags),
+        'coords': _write_array(path, 'coords', mesh.coords),
+        'blocks': [],
+        'groups': [],
+    }
+    for etype, connectivity in mesh.connectivity.items():
+        name, dim, order, n_nodes = mesh.element_types[etype]
+        header['blocks'].append({
+            'type': int(etype),
+            'name': name,
+            'dim': int(dim),
+            'order': int(order),
+            'n_nodes': int(n_nodes),
+            'element_tags': _write_array(path, f'element_tags_{etype}', mesh.element_tags[etype]),
+            'connectivity': _write_array(path, f'connectivity_{etype}', connectivity),
+        })
+    for i, (name, (dim, tags)) in enumerate(mesh.groups.items()):
+        header['groups'].append({
+            'name': name,
+            'dim': int(dim),
+            'element_tags': _write_array(path, f'group_{i}', tags),
+        })
+
+    # Written last, so a bundle with a header is always complete
+    with open(os.path.join(path, HEADER_NAME), 'w') as file:
+        json.dump(header, file, indent=2)
+
+
+def save_bundle(path, mesh):
+    """Persists a ``gmsh_api.Mesh`` as a raw-array bundle directory.
+
+    The bundle holds a small JSON header plus one flat binary file per array:
+    node tags, coordinates, element tags and connectivity per element type and
+    element tags per physical group. It is written to a new directory next to
+    ``path`` then moved in place, so the files of an existing bundle are never
+    rewritten under the arrays mapped from them by ``load_bundle``.
+    """
+    path = os.path.abspath(path)
+    parent, name = os.path.split(path)
+    staging = tempfile.mkdtemp(prefix=f'.{name}.', dir=parent)
+    try:
+        # mkdtemp creates the directory private to the user
+        os.chmod(staging, os.stat(parent).st_mode & 0o777)
+        _write_bundle(staging, mesh)
+        if os.path.exists(path):
+            # Directories cannot be replaced while they hold files, the old
+            # one is moved aside first; mapped files survive being unlinked
+            previous = tempfile.mkdtemp(prefix=f'.{name}.', dir=parent)
+            os.replace(path, previous)
+            os.replace(staging, path)
+            shutil.rmtree(previous, ignore_errors=True)
+        else:
+            os.replace(staging, path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def load_bundle(path):
+    """Reopens a bundle as a ``gmsh_api.Mesh`` backed by memory-mapped arrays.
+
+    Only the header is read; array pages are loaded by the OS on first access.
+    """
+    from ._vendor.gmsh_api import Mesh
+
+    with open(os.path.join(path, HEADER_NAME), 'r') as file:
+        header = json.load(file)
+    if header.get('version') != BUNDLE_VERSION:
+        raise ValueError(f"Unsupported mesh bundle version: {header.get('version')}")
+
+    element_tags = {}
+    connectivity = {}
+    element_types = {}
+    for block in header['blocks']:
+        etype = block['type']
+        element_tags[etype] = _map_array(path, block['element_tags'])
+        connectivity[etype] = _map_array(path, block['connectivity'])
+        element_types[etype] = (block['name'], block['dim'], block['order'], block['n_nodes'])
+
+    groups = {group['name']: (group['dim'], _map_array(path, group['element_tags'])) for group in header['groups']}
+
+    return Mesh(
+        _map_array(path, header['node_tags']),
+        _map_array(path, header['coords']),
+        element_tags, connectivity, element_types, groups,
+    )
@@ -0,0 +1,70 @@
+import bpy
+from bpy.app.handlers import persistent
+
+# Object pointer -> number of geometry/transform updates seen by the depsgraph.
+_revisions = {}
+
+# Object pointer -> (revision, mesh data pointer, frame, (nodes, triangles, materials)).
+_entries = {}
+
+
+def _key(obj):
+    return obj.original.as_pointer()
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    for update in depsgraph.updates:
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        if update.is_updated_geometry or update.is_updated_transform:
+            key = _key(update.id)
+            _revisions[key] = _revisions.get(key, 0) + 1
+
+
+@persistent
+def _on_load(*args):
+    clear()
+
+
+def get_arrays(obj, depsgraph):
+    """Returns the cached ``(nodes, triangles, materials)`` of ``obj``, extracting them if stale.
+
+    Entries are keyed by object pointer and invalidated whenever the depsgraph
+    reports a geometry or transform update for that object, so initializing an
+    unchanged object twice only extracts its arrays once. Frame changes do not
+    go through ``depsgraph_update_post``, so the frame is part of the entry too
+    and animated objects are extracted again on every frame.
+    """
+    key = _key(obj)
+    revision = _revisions.get(key, 0)
+    frame = (depsgraph.scene.frame_current, depsgraph.scene.frame_subframe)
+    entry = _entries.get(key)
+    if entry is not None and entry[:3] == (revision, obj.data.as_pointer(), frame):
+        return entry[3]
+
+    # Deferred so enabling the add-on does not import numpy
+    from .geometry import object_to_arrays
+
+    arrays = object_to_arrays(obj, depsgraph)
+    _entries[key] = (revision, obj.data.as_pointer(), frame, arrays)
+    return arrays
+
+
+def clear():
+    """Drops every cached entry."""
+    _revisions.clear()
+    _entries.clear()
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load)
+
+
+def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load)
+    clear()
@@ -0,0 +1,199 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Job settings used when neither the job nor the manifest defaults give them,
+# the same as the add-on properties.
+DEFAULTS = {
+    'cl_max': 0.1,
+    'element_order': 1,
+    'mesh_dimension': 3,
+    'algorithm': 0,
+    'formats': ['.msh'],
+    'bundle': True,
+    'weld_tolerance': 1e-6,
+}
+
+USAGE = '''Meshes every job of a JSON manifest in parallel and writes a results file.
+
+Manifest layout:
+  {
+    "workspace": "meshes/",
+    "workers": 4,
+    "results": "results.json",
+    "defaults": {"cl_max": 0.2, "mesh_dimension": 3, "formats": [".msh", ".vtk"]},
+    "jobs": [
+      {"object": "Bracket", "cl_max": 0.1},
+      {"stl": "parts/housing.stl", "name": "housing", "algorithm": 1}
+    ]
+  }
+
+"object" jobs mesh objects of the open .blend file and need Blender:
+  blender -b parts.blend --python blendmsh/cli.py -- manifest.json
+"stl" jobs also run with a plain interpreter:
+  python -m blendmsh.cli manifest.json
+Relative paths are resolved against the manifest directory.
+'''
+
+
+def _resolve(base, path):
+    return os.path.normpath(os.path.join(base, os.path.expanduser(path)))
+
+
+def load_manifest(path):
+    """Reads a manifest and returns ``(jobs, workers, results path, workspace)``.
+
+    Every job comes back as a dict with its name, source and complete
+    settings, the manifest defaults and ``DEFAULTS`` filled in.
+    """
+    with open(path, 'r') as file:
+        manifest = json.load(file)
+
+    base = os.path.dirname(os.path.abspath(path))
+    workspace = _resolve(base, manifest.get('workspace', '.'))
+    defaults = dict(DEFAULTS, **manifest.get('defaults', {}))
+
+    jobs = []
+    for i, entry in enumerate(manifest.get('jobs', [])):
+        job = dict(defaults, **entry)
+        if 'object' in job:
+            job.setdefault('name', job['object'])
+        elif 'stl' in job:
+            job['stl'] = _resolve(base, job['stl'])
+            job.setdefault('name', os.path.splitext(os.path.basename(job['stl']))[0])
+        else:
+            raise ValueError(f'Job {i} has neither an "object" nor an "stl" source.')
+        if isinstance(job['formats'], str):
+            job['formats'] = [job['formats']]
+        job['outputs'] = [os.path.join(workspace, job['name'] + '.stl' + fmt) for fmt in job['formats']]
+        jobs.append(job)
+
+    names = [job['name'] for job in jobs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Job names must be unique, repeated: {', '.join(duplicates)}.")
+
+    results = _resolve(base, manifest.get('results', 'results.json'))
+    return jobs, manifest.get('workers'), results, workspace
+
+
+def _extract(job):
+    """Returns the ``(nodes, triangles, groups, group_names)`` of a job's geometry."""
+    from .geometry import material_groups, object_to_arrays, weld_vertices
+
+    if 'stl' in job:
+        from .stl import read_stl
+        nodes, triangles, _ = weld_vertices(read_stl(job['stl']), job['weld_tolerance'])
+        return nodes, triangles, None, ()
+
+    try:
+        import bpy
+    except ImportError:
+        raise RuntimeError('Object jobs need to run inside Blender.')
+    obj = bpy.data.objects.get(job['object'])
+    if obj is None or obj.type != 'MESH':
+        raise ValueError(f"No mesh object named {job['object']}.")
+    nodes, triangles, materials = object_to_arrays(obj, bpy.context.evaluated_depsgraph_get())
+    groups, group_names = material_groups(obj, materials)
+    return nodes, triangles, groups, group_names
+
+
+def run(jobs, workers=None, poll_interval=0.1):
+    """Meshes every job across a process pool, returns one result dict per job."""
+    from .batch import Batch
+
+    results = {}
+    tasks = []
+    for job in jobs:
+        result = results[job['name']] = {
+            'name': job['name'],
+            'source': job.get('stl', job.get('object')),
+            'outputs': job['outputs'],
+            'status': 'failed',
+        }
+        start = time.perf_counter()
+        try:
+            nodes, triangles, groups, group_names = _extract(job)
+        except Exception as e:
+            result['error'] = str(e)
+            continue
+        result['extract_time'] = time.perf_counter() - start
+        result['input_triangles'] = len(triangles)
+        if len(triangles) == 0:
+            result['error'] = 'No faces to mesh.'
+            continue
+
+        os.makedirs(os.path.dirname(job['outputs'][0]), exist_ok=True)
+        kwargs = dict(
+            output_file=job['outputs'],
+            cl_max=float(job['cl_max']),
+            element_order=int(job['element_order']),
+            mesh_dimension=int(job['mesh_dimension']),
+            algorithm=int(job['algorithm']),
+            bundle=bool(job['bundle']),
+        )
+        if groups is not None:
+            kwargs.update(groups=groups, group_names=list(group_names))
+        tasks.append((job['name'], 'mesh_arrays', (nodes, triangles), kwargs))
+
+    if tasks:
+        batch = Batch(tasks, max_workers=workers).start()
+        while not batch.poll():
+            time.sleep(poll_interval)
+        for name, counts in batch.results.items():
+            results[name].update(counts, status='done')
+        for name, error in batch.errors.items():
+            results[name]['error'] = error
+
+    return [results[job['name']] for job in jobs]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='blendmsh', description=USAGE, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('manifest', help='JSON job manifest')
+    parser.add_argument('--workers', type=int, help='Meshing processes, defaults to the manifest or the CPU count')
+    parser.add_argument('--results', help='Results file, overrides the manifest')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    jobs, workers, results_path, workspace = load_manifest(args.manifest)
+    results = run(jobs, workers=args.workers or workers)
+    failed = [result['name'] for result in results if result['status'] != 'done']
+
+    report = {
+        'manifest': os.path.abspath(args.manifest),
+        'workspace': workspace,
+        'elapsed': time.perf_counter() - start,
+        'succeeded': len(results) - len(failed),
+        'failed': len(failed),
+        'jobs': results,
+    }
+    results_path = args.results or results_path
+    os.makedirs(os.path.dirname(os.path.abspath(results_path)), exist_ok=True)
+    with open(results_path, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    for result in results:
+        if result['status'] == 'done':
+            print(f"{result['name']}: {result['n_nodes']} nodes, {result['n_elements']} elements "
+                  f"in {result['time']:.2f}s")
+        else:
+            print(f"{result['name']}: failed ({result.get('error')})")
+    print(f"{report['succeeded']}/{len(results)} jobs meshed in {report['elapsed']:.2f}s, results in {results_path}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    if __package__:
+        sys.exit(main())
+
+    # Run as a script, e.g. from 'blender -b parts.blend --python cli.py -- manifest.json':
+    # import the package by name so its relative imports and the pool workers resolve
+    import importlib
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.dirname(package_dir))
+    cli = importlib.import_module(os.path.basename(package_dir) + '.cli')
+    sys.exit(cli.main(sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]))
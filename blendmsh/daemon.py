@@ -0,0 +1,593 @@
+import argparse
+import heapq
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import connection
+
+from .jobs import SharedInputs, attached, encode_shared
+
+# The daemon listens on a Unix socket, not available on Windows.
+SUPPORTED = hasattr(socket, 'AF_UNIX')
+
+# Times a job is handed to a fresh worker after its worker died while running it.
+MAX_RESTARTS = 1
+
+# Seconds between two scheduler passes when no worker reports anything.
+POLL_INTERVAL = 0.1
+
+# Pipeline functions a client may submit, the only ones a worker ever calls.
+FUNCTIONS = ('mesh_arrays', 'mesh_file')
+
+
+def private_dir():
+    """Returns a directory only the current user can access, for the daemon socket.
+
+    ``$XDG_RUNTIME_DIR`` is private by definition; otherwise a per-user
+    directory is created in the temporary directory, and refused if it
+    exists with another owner or looser permissions.
+    """
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime and os.path.isdir(runtime):
+        return runtime
+    path = os.path.join(tempfile.gettempdir(), f'blendmsh-{os.getuid()}')
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f'{path} is not a directory private to the current user.')
+    return path
+
+
+def default_socket_path():
+    return os.path.join(private_dir(), 'blendmsh.sock')
+
+
+def default_workers():
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def _send(sock, lock, message):
+    """Writes one JSON message, returns False once the peer is gone."""
+    data = (json.dumps(message) + '\n').encode('utf-8')
+    try:
+        with lock:
+            sock.sendall(data)
+        return True
+    except OSError:
+        return False
+
+
+def _worker(tasks, events):
+    """Warm worker process: initializes Gmsh once and runs the jobs it is handed.
+
+    Events go through a pipe of its own, so killing the worker cannot leave
+    a half-written message in a channel shared with other workers.
+    """
+    from . import pipeline, tracing
+
+    gmsh = pipeline.load_gmsh()
+    gmsh.initialize(interruptible=False)
+    events.send((None, 'ready', None))
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        job, function, args, kwargs = task
+
+        def progress(stage):
+            events.send((job, 'stage', stage))
+
+        start = time.perf_counter()
+        try:
+            # The blocks are owned by the client, which lives under another resource tracker
+            with attached(args, kwargs, unregister=True) as (args, kwargs):
+                result = tracing.call(getattr(pipeline, function), *args, progress=progress, **kwargs)
+            events.send((job, 'done', dict(result, time=time.perf_counter() - start)))
+        except Exception as e:
+            events.send((job, 'error', str(e)))
+
+    gmsh.finalize()
+
+
+class _Job():
+
+    def __init__(self, id, priority, function, args, kwargs, sock, lock):
+        self.id = id
+        self.priority = priority
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.sock = sock
+        self.lock = lock
+        self.worker = None
+        self.restarts = 0
+        self.cancelled = False
+
+
+class Daemon():
+    """Serves meshing jobs from a priority queue to ``workers`` warm processes.
+
+    Each worker imports the meshing backend and initializes Gmsh once, then
+    meshes job after job, so a job only costs its meshing time. Clients talk
+    to the daemon over a Unix socket with newline-delimited JSON messages;
+    geometry arrays never go through the socket, they are passed as shared
+    memory blocks owned by the client. Run it with
+    ``python -m blendmsh.daemon --socket PATH --workers N`` or ``start_daemon``.
+
+    Lower ``priority`` values run first, jobs of equal priority in submission
+    order. Every client connection receives the status events of the jobs it
+    submitted: ``queued``, ``running``, ``stage``, then ``done``, ``error`` or
+    ``cancelled``.
+    """
+
+    def __init__(self, path=None, workers=None):
+        self.path = path or default_socket_path()
+        self.n_workers = workers or default_workers()
+        self._context = multiprocessing.get_context('spawn')
+        self._workers = []
+        self._queue = []
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._running = False
+        self._server = None
+
+    # -- workers
+
+    def _spawn(self, index):
+        tasks = self._context.Queue()
+        events, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker, args=(tasks, sender), name=f'blendmsh-worker-{index}', daemon=True)
+        process.start()
+        sender.close()
+        worker = {'process': process, 'tasks': tasks, 'events': events, 'job': None, 'ready': False, 'failed': False}
+        if index < len(self._workers):
+            self._workers[index] = worker
+        else:
+            self._workers.append(worker)
+
+    def _restart(self, index):
+        worker = self._workers[index]
+        if worker['process'].is_alive():
+            worker['process'].terminate()
+        worker['process'].join()
+        worker['tasks'].close()
+        worker['events'].close()
+        self._spawn(index)
+
+    def _dispatch(self):
+        for index, worker in enumerate(self._workers):
+            if not worker['ready'] or worker['job'] is not None:
+                continue
+            job = None
+            while self._queue and job is None:
+                _, _, candidate = heapq.heappop(self._queue)
+                if not candidate.cancelled:
+                    job = candidate
+            if job is None:
+                return
+            job.worker = index
+            worker['job'] = job
+            worker['tasks'].put((job.id, job.function, job.args, job.kwargs))
+            _send(job.sock, job.lock, {'job': job.id, 'status': 'running'})
+
+    def _finish(self, job, message):
+        self._jobs.pop(job.id, None)
+        if job.worker is not None:
+            self._workers[job.worker]['job'] = None
+        _send(job.sock, job.lock, dict(message, job=job.id))
+
+    def _schedule(self):
+        """Scheduler thread: routes worker events and replaces dead workers."""
+        while self._running:
+            with self._lock:
+                readers = {worker['events']: index for index, worker in enumerate(self._workers)
+                           if not worker['failed']}
+            if readers:
+                ready = connection.wait(list(readers), timeout=POLL_INTERVAL)
+            else:
+                ready = []
+                time.sleep(POLL_INTERVAL)
+            with self._lock:
+                for reader in ready:
+                    index = readers[reader]
+                    if self._workers[index]['events'] is not reader:
+                        # Replaced meanwhile
+                        continue
+                    try:
+                        job_id, kind, value = reader.recv()
+                    except (EOFError, OSError):
+                        # The worker is gone, handled below
+                        continue
+                    self._on_event(index, job_id, kind, value)
+                for index, worker in enumerate(self._workers):
+                    if worker['failed'] or worker['process'].is_alive():
+                        continue
+                    if not worker['ready']:
+                        # Died while loading Gmsh, restarting would only fail again
+                        worker['failed'] = True
+                        continue
+                    job = worker['job']
+                    self._restart(index)
+                    if job is None:
+                        continue
+                    job.worker = None
+                    if job.restarts < MAX_RESTARTS:
+                        job.restarts += 1
+                        heapq.heappush(self._queue, (job.priority, next(self._order), job))
+                    else:
+                        self._finish(job, {'status': 'error', 'error': 'Meshing worker exited unexpectedly.'})
+                if all(worker['failed'] for worker in self._workers):
+                    while self._queue:
+                        _, _, job = heapq.heappop(self._queue)
+                        if not job.cancelled:
+                            self._finish(job, {'status': 'error', 'error': 'No meshing worker could load Gmsh.'})
+                self._dispatch()
+
+    def _on_event(self, index, job_id, kind, value):
+        worker = self._workers[index]
+        if kind == 'ready':
+            worker['ready'] = True
+            return
+        job = worker['job']
+        if job is None or job.id != job_id:
+            # Late event of a job cancelled meanwhile
+            return
+        if kind == 'stage':
+            _send(job.sock, job.lock, {'job': job.id, 'status': 'stage', 'stage': value})
+        elif kind == 'done':
+            self._finish(job, {'status': 'done', 'result': value})
+        else:
+            self._finish(job, {'status': 'error', 'error': value})
+
+    # -- clients
+
+    def _cancel(self, job):
+        job.cancelled = True
+        if job.worker is not None:
+            # Gmsh cannot be interrupted, the worker is replaced by a fresh one
+            index = job.worker
+            self._restart(index)
+        self._finish(job, {'status': 'cancelled'})
+
+    def _handle(self, request, sock, lock, owned):
+        op = request.get('op')
+        if op == 'submit':
+            try:
+                function = request['function']
+                if function not in FUNCTIONS:
+                    raise ValueError(f'unknown function {function!r}')
+                priority = int(request.get('priority', 0))
+                # Shared arrays stay encoded, the worker maps them
+                args = list(request.get('args', []))
+                kwargs = dict(request.get('kwargs', {}))
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                _send(sock, lock, {
+                    'status': 'error', 'ref': request.get('ref'), 'error': f'Invalid submit request: {e!r}',
+                })
+                return
+            job = _Job(next(self._ids), priority, function, args, kwargs, sock, lock)
+            self._jobs[job.id] = job
+            owned.add(job.id)
+            heapq.heappush(self._queue, (job.priority, next(self._order), job))
+            _send(sock, lock, {'job': job.id, 'status': 'queued', 'ref': request.get('ref')})
+            self._dispatch()
+        elif op == 'cancel':
+            job = self._jobs.get(request.get('job'))
+            if job is not None:
+                self._cancel(job)
+        elif op == 'status':
+            _send(sock, lock, {
+                'status': 'daemon',
+                'workers': len(self._workers),
+                'ready': sum(worker['ready'] for worker in self._workers),
+                'running': sum(worker['job'] is not None for worker in self._workers),
+                'queued': sum(not job.cancelled for _, _, job in self._queue),
+            })
+        elif op == 'shutdown':
+            self._running = False
+            # Wakes up the accept() of serve_forever
+            self._server.shutdown(socket.SHUT_RDWR)
+        else:
+            _send(sock, lock, {'status': 'error', 'error': f'Unknown operation: {op}'})
+
+    def _serve_client(self, sock):
+        lock = threading.Lock()
+        owned = set()
+        try:
+            for line in sock.makefile('rb'):
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    _send(sock, lock, {'status': 'error', 'error': f'Invalid message: {e}'})
+                    continue
+                if not isinstance(request, dict):
+                    _send(sock, lock, {'status': 'error', 'error': 'Invalid message: not an object'})
+                    continue
+                with self._lock:
+                    self._handle(request, sock, lock, owned)
+        except OSError:
+            pass
+        finally:
+            # The client owned the shared input arrays, its pending jobs go with it
+            with self._lock:
+                for job_id in owned:
+                    job = self._jobs.get(job_id)
+                    if job is not None:
+                        self._cancel(job)
+            sock.close()
+
+    def serve_forever(self):
+        # Only a stale socket is replaced, never a file that happens to be there
+        # nor the socket of a daemon still running
+        if os.path.exists(self.path) and stat.S_ISSOCK(os.lstat(self.path).st_mode):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                os.unlink(self.path)
+            else:
+                raise RuntimeError(f'A meshing daemon is already running on {self.path}.')
+            finally:
+                probe.close()
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen()
+        self._running = True
+
+        for index in range(self.n_workers):
+            self._spawn(index)
+        scheduler = threading.Thread(target=self._schedule, name='blendmsh-scheduler', daemon=True)
+        scheduler.start()
+
+        try:
+            while self._running:
+                try:
+                    sock, _ = self._server.accept()
+                except OSError:
+                    break
+                threading.Thread(target=self._serve_client, args=(sock,), daemon=True).start()
+        finally:
+            self._running = False
+            scheduler.join()
+            for worker in self._workers:
+                worker['tasks'].put(None)
+            for worker in self._workers:
+                worker['process'].join(timeout=5)
+                if worker['process'].is_alive():
+                    worker['process'].terminate()
+            self._server.close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+
+class Client():
+    """Connection to a running daemon.
+
+    Events are read without blocking by ``poll``, so the client can be
+    driven from a Blender timer.
+    """
+
+    def __init__(self, path=None, timeout=5.0):
+        self.path = path or default_socket_path()
+        self.timeout = timeout
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(self.path)
+        self._lock = threading.Lock()
+        self._buffer = b''
+        self._pending = []
+        self._refs = itertools.count(1)
+
+    def _read(self, block):
+        # Blocking reads give up after ``timeout`` seconds with a TimeoutError
+        self._sock.settimeout(self.timeout if block else 0.0)
+        try:
+            data = self._sock.recv(1 << 16)
+        except BlockingIOError:
+            return
+        if not data:
+            raise ConnectionError('The meshing daemon closed the connection.')
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b'\n')
+        self._pending.extend(json.loads(line) for line in lines if line.strip())
+
+    def submit(self, function, *args, priority=0, **kwargs):
+        """Queues ``pipeline.<function>(*args, **kwargs)`` and returns the job id.
+
+        Array arguments must already be shared, as in ``jobs.SharedInputs``,
+        and kept alive by the caller until the job has finished.
+        """
+        ref = next(self._refs)
+        _send(self._sock, self._lock, {
+            'op': 'submit',
+            'ref': ref,
+            'priority': priority,
+            'function': function,
+            'args': [encode_shared(value) for value in args],
+            'kwargs': {key: encode_shared(value) for key, value in kwargs.items()},
+        })
+        while True:
+            for event in self._pending:
+                if event.get('ref') != ref:
+                    continue
+                self._pending.remove(event)
+                if event.get('status') == 'error':
+                    raise ValueError(event['error'])
+                return event['job']
+            self._read(True)
+
+    def cancel(self, job):
+        _send(self._sock, self._lock, {'op': 'cancel', 'job': job})
+
+    def status(self):
+        _send(self._sock, self._lock, {'op': 'status'})
+        while True:
+            for event in self._pending:
+                if event.get('status') == 'daemon':
+                    self._pending.remove(event)
+                    return event
+            self._read(True)
+
+    def shutdown(self):
+        _send(self._sock, self._lock, {'op': 'shutdown'})
+
+    def poll(self):
+        """Returns the events received so far, without blocking."""
+        self._read(False)
+        events, self._pending = self._pending, []
+        return events
+
+    def close(self):
+        self._sock.close()
+
+
+def start_daemon(path=None, workers=None, timeout=30.0):
+    """Starts a daemon in the background unless one already answers on ``path``.
+
+    The daemon runs the Python interpreter of the current process with the
+    same import path, so it finds the same numpy and Gmsh.
+    """
+    path = path or default_socket_path()
+    try:
+        Client(path).close()
+        return path
+    except OSError:
+        pass
+
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    subprocess.Popen(
+        [sys.executable, '-m', os.path.basename(package_dir) + '.daemon',
+         '--socket', path, '--workers', str(workers or default_workers())],
+        cwd=os.path.dirname(package_dir), env=env,
+        stdin=subprocess.DEVNULL, start_new_session=True,
+    )
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            Client(path).close()
+            return path
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f'Meshing daemon did not start on {path}.')
+            time.sleep(0.1)
+
+
+class DaemonJob():
+    """A meshing job run by the daemon, polled like a ``jobs.MeshJob``."""
+
+    def __init__(self, function, *args, priority=0, path=None, **kwargs):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.path = path
+        self.stage = None
+        self.error = None
+        self.result = None
+        # The daemon only sends the counts back
+        self.mesh = None
+        self.finished = False
+        self.cancelled = False
+        self.started = None
+        self.elapsed = 0.0
+        self._client = None
+        self._inputs = None
+        self._id = None
+
+    def start(self):
+        self._client = Client(start_daemon(self.path))
+        self._inputs = SharedInputs(self.args, self.kwargs)
+        self.started = time.perf_counter()
+        try:
+            self._id = self._client.submit(self.function, *self._inputs.args, priority=self.priority,
+                                           **self._inputs.kwargs)
+        except Exception:
+            self._finish()
+            raise
+        return self
+
+    def poll(self):
+        if self.finished:
+            return True
+        self.elapsed = time.perf_counter() - self.started
+        try:
+            events = self._client.poll()
+        except ConnectionError as e:
+            self.error = str(e)
+            self._finish()
+            return True
+        for event in events:
+            if event.get('job') != self._id:
+                continue
+            status = event['status']
+            if status == 'stage':
+                self.stage = event['stage']
+            elif status == 'done':
+                self.result = event['result']
+                self._finish()
+            elif status == 'error':
+                self.error = event['error']
+                self._finish()
+            elif status == 'cancelled':
+                self.cancelled = True
+                self._finish()
+        return self.finished
+
+    def cancel(self):
+        if self.finished:
+            return
+        self._client.cancel(self._id)
+        self.cancelled = True
+        self._finish()
+
+    @property
+    def progress(self):
+        from .pipeline import STAGES
+
+        if self.finished:
+            return 1.0
+        if self.stage not in STAGES:
+            return 0.0
+        return STAGES.index(self.stage) / len(STAGES)
+
+    @property
+    def n_nodes(self):
+        return self.result['n_nodes'] if self.result else 0
+
+    @property
+    def n_elements(self):
+        return self.result['n_elements'] if self.result else 0
+
+    def _finish(self):
+        self.finished = True
+        self.elapsed = time.perf_counter() - self.started
+        self._client.close()
+        self._inputs.release()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Blendmsh meshing daemon.')
+    parser.add_argument('--socket', default=default_socket_path(), help='Unix socket to listen on')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='Concurrent meshing processes')
+    args = parser.parse_args(argv)
+    Daemon(args.socket, args.workers).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
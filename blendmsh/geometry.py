@@ -0,0 +1,114 @@
+import time
+import numpy as np
+
+
+def object_to_arrays(obj, depsgraph):
+    """Extracts world-space vertices and triangle indices from a mesh object.
+
+    Returns a ``(N, 3)`` float64 coordinate array, a ``(M, 3)`` int32 array
+    of 0-based vertex indices and the ``(M,)`` material index of every
+    triangle, read with ``foreach_get`` from the evaluated mesh's
+    ``loop_triangles`` so no per-vertex Python work is done.
+    """
+    evaluated = obj.evaluated_get(depsgraph)
+    mesh = evaluated.to_mesh()
+    try:
+        mesh.calc_loop_triangles()
+
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', co)
+
+        triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get('vertices', triangles)
+
+        materials = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+        mesh.loop_triangles.foreach_get('material_index', materials)
+    finally:
+        evaluated.to_mesh_clear()
+
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    nodes = co.reshape(-1, 3) @ matrix[:3, :3].T
+    nodes += matrix[:3, 3]
+
+    return nodes, triangles.reshape(-1, 3), materials
+
+
+def material_groups(obj, materials):
+    """Returns the ``(groups, group_names)`` pipeline arguments of a mesh object.
+
+    Faces assigned to different material slots become separate physical
+    groups named after the slot materials. Objects with less than two slots
+    get no groups.
+    """
+    slots = obj.material_slots
+    if len(slots) < 2:
+        return None, ()
+    names = [slot.material.name if slot.material else f'GROUP_{i}' for i, slot in enumerate(slots)]
+    return materials, names
+
+
+def surface_triangles(mesh):
+    """Returns the ``(nodes, triangles)`` arrays of the triangles of a ``gmsh_api.Mesh``.
+
+    Higher order triangles are reduced to their corner nodes. Only the nodes
+    used by a triangle are kept, and ``triangles`` indexes them from 0.
+    """
+    blocks = [mesh.nidxs[etype][:, :3] for etype, (name, _, _, _) in mesh.element_types.items()
+              if name.startswith('Triangle')]
+    if not blocks:
+        return np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.int32)
+    used, triangles = np.unique(np.concatenate(blocks), return_inverse=True)
+    return mesh.coords[used], triangles.reshape(-1, 3).astype(np.int32)
+
+
+def _lattice_keys(points, tolerance):
+    """Snaps points to an integer lattice and packs each cell into one int64 key.
+
+    Returns the packed keys, or None when the lattice is too wide to fit 21
+    bits per axis, along with the ``(N, 3)`` lattice cells.
+    """
+    cells = np.floor(points / tolerance + 0.5).astype(np.int64)
+    if len(cells) == 0:
+        return cells[:, 0], cells
+    cells -= cells.min(axis=0)
+    if cells.max() >= 1 << 21:
+        return None, cells
+    return (cells[:, 0] << 42) | (cells[:, 1] << 21) | cells[:, 2], cells
+
+
+def weld_vertices(facets, tolerance):
+    """Merges facet corners closer than ``tolerance`` into shared nodes.
+
+    ``facets`` is an ``(M, 3, 3)`` array of triangle corners as read from an
+    STL file. Returns the compact ``(N, 3)`` node coordinates, the ``(K, 3)``
+    0-based triangle connectivity with collapsed triangles removed, and a dict
+    with the vertex counts, weld ratio and elapsed time.
+    """
+    start = time.perf_counter()
+    points = np.asarray(facets, dtype=np.float64).reshape(-1, 3)
+
+    keys, cells = _lattice_keys(points, tolerance)
+    if keys is not None:
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    else:
+        # Compare whole rows as raw bytes, much cheaper than np.unique(axis=0)
+        rows = np.ascontiguousarray(cells).view(np.dtype((np.void, cells.dtype.itemsize * 3))).reshape(-1)
+        _, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+
+    nodes = points[first]
+    triangles = inverse.reshape(-1, 3)
+    collapsed = (
+        (triangles[:, 0] == triangles[:, 1])
+        | (triangles[:, 1] == triangles[:, 2])
+        | (triangles[:, 0] == triangles[:, 2])
+    )
+    triangles = triangles[~collapsed]
+
+    stats = {
+        'input_vertices': len(points),
+        'output_vertices': len(nodes),
+        'weld_ratio': len(points) / max(len(nodes), 1),
+        'collapsed_triangles': int(collapsed.sum()),
+        'time': time.perf_counter() - start,
+    }
+    return nodes, triangles, stats
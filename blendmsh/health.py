@@ -0,0 +1,56 @@
+import importlib
+import threading
+
+# Result of the dependency check, None until it has completed once.
+_report = None
+_thread = None
+_lock = threading.Lock()
+
+
+def check_dependencies():
+    """Probes the meshing dependencies and returns a report dict.
+
+    The report holds the numpy version, the vendored Gmsh API version, the
+    path of the Gmsh shared library that was loaded and a list of problems,
+    empty when everything is usable.
+    """
+    report = {'numpy': None, 'gmsh_api': None, 'gmsh_library': None, 'problems': []}
+
+    try:
+        numpy = importlib.import_module('numpy')
+        report['numpy'] = numpy.__version__
+    except ImportError as e:
+        report['problems'].append(f'numpy is not available: {e}')
+
+    try:
+        gmsh = importlib.import_module(__package__ + '._vendor.gmsh')
+        report['gmsh_api'] = gmsh.GMSH_API_VERSION
+        report['gmsh_library'] = gmsh.libpath
+        if not gmsh.libpath:
+            report['problems'].append(f'Gmsh shared library {gmsh.libname} was not found.')
+        elif not hasattr(gmsh.lib, 'gmshInitialize'):
+            report['problems'].append(f'{gmsh.libpath} does not export the Gmsh API.')
+    except Exception as e:
+        # Loading the shared library raises OSError rather than ImportError
+        report['problems'].append(f'The vendored gmsh module failed to load: {e}')
+
+    return report
+
+
+def start_check():
+    """Runs ``check_dependencies`` once per session in a daemon thread."""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name='blendmsh-health-check', daemon=True)
+            _thread.start()
+
+
+def _run():
+    global _report
+    _report = check_dependencies()
+
+
+def get_report():
+    """Returns the cached dependency report, or None while the check is running."""
+    return _report
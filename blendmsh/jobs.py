@@ -0,0 +1,427 @@
+import contextlib
+import importlib
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from collections import namedtuple
+
+# numpy and shared_memory are imported where used: the add-on imports this
+# module at startup for ``current``, before the meshing backend is loaded.
+
+# The meshing job currently running in the background, shown in the panel.
+current = None
+
+# Times a job is started again after its process died without reporting.
+MAX_RESTARTS = 1
+
+# Stands in for an array in the arguments and results sent between processes.
+# ``name`` is the shared memory block holding it, None for empty arrays.
+SharedArray = namedtuple('SharedArray', ('name', 'shape', 'dtype'))
+
+# Blocks mapped by ``attached`` whose arrays outlived the job, kept mapped for
+# as long as the process lives.
+_retained = []
+
+
+def package_path():
+    """Returns the directory holding this package and the package's top-level name."""
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(package_dir), os.path.basename(package_dir)
+
+
+@contextlib.contextmanager
+def spawning():
+    """Lets the processes started in the block import this package by its top-level name.
+
+    As a Blender 4.2 extension the package is imported as
+    ``bl_ext.<repository>.blendmsh``, a parent package Blender creates in
+    memory that a spawned interpreter cannot import. Spawned processes start
+    from a copy of ``sys.path``, taken when they are started; the directory
+    holding the package is added to it meanwhile.
+    """
+    parent, _ = package_path()
+    if parent in sys.path:
+        yield
+        return
+    sys.path.insert(0, parent)
+    try:
+        yield
+    finally:
+        sys.path.remove(parent)
+
+
+class _Module():
+
+    def __init__(self, name):
+        self.name = name
+
+    def __reduce__(self):
+        return importlib.import_module, (self.name,)
+
+
+class _Importable():
+    """A module-level function of this package, pickled by its top-level module name."""
+
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, *args, **kwargs):
+        return self.function(*args, **kwargs)
+
+    def __reduce__(self):
+        _, package = package_path()
+        module = package + '.' + self.function.__module__.rpartition('.')[2]
+        return getattr, (_Module(module), self.function.__qualname__)
+
+
+def importable(function):
+    """Wraps a process entry point so children started in ``spawning`` can unpickle it."""
+    return _Importable(function)
+
+
+def encode_shared(value):
+    """Turns a ``SharedArray`` into plain values, left as is by other arguments.
+
+    Messages between processes only hold plain values: unpickling a class of
+    this package would import it by a name the other process may not know.
+    """
+    if isinstance(value, SharedArray):
+        return {'shared': [value.name, list(value.shape), value.dtype]}
+    return value
+
+
+def decode_shared(value):
+    """Rebuilds a ``SharedArray`` encoded by ``encode_shared``, leaves other values as is."""
+    if isinstance(value, dict) and set(value) == {'shared'}:
+        name, shape, dtype = value['shared']
+        return SharedArray(name, tuple(shape), dtype)
+    return value
+
+
+def share_array(array):
+    """Copies an array into a new shared memory block, returns ``(block, SharedArray)``."""
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    array = np.ascontiguousarray(array)
+    if array.nbytes == 0:
+        return None, SharedArray(None, array.shape, array.dtype.str)
+    shm = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm, SharedArray(shm.name, array.shape, array.dtype.str)
+
+
+def attach_array(shared):
+    """Maps a ``SharedArray`` created by another process, returns ``(block, array view)``."""
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    if shared.name is None:
+        return None, np.empty(shared.shape, dtype=shared.dtype)
+    shm = shared_memory.SharedMemory(name=shared.name)
+    return shm, np.ndarray(shared.shape, dtype=shared.dtype, buffer=shm.buf)
+
+
+class SharedInputs():
+    """The arguments of a job, with every numpy array copied into shared memory.
+
+    ``args`` and ``kwargs`` hold the encoded ``SharedArray`` of each array,
+    ready to be sent to another process, which maps them with ``attached``.
+    The blocks belong to this process and are unlinked by ``release``.
+    """
+
+    def __init__(self, args, kwargs):
+        self._blocks = []
+        self.args = [self._share(value) for value in args]
+        self.kwargs = {key: self._share(value) for key, value in kwargs.items()}
+
+    def _share(self, value):
+        import numpy as np
+
+        if isinstance(value, np.ndarray):
+            shm, shared = share_array(value)
+            self._blocks.append(shm)
+            return encode_shared(shared)
+        return value
+
+    def release(self):
+        for shm in self._blocks:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        self._blocks = []
+
+
+@contextlib.contextmanager
+def attached(args, kwargs, unregister=False):
+    """Maps the shared arrays among the arguments of a job, yields ``(args, kwargs)`` with the arrays.
+
+    The views are dropped and the blocks closed on exit, as pool and daemon
+    workers run job after job; a block is left mapped if its array is still
+    referenced. ``unregister`` is for blocks owned by a process under another
+    resource tracker, as the daemon's clients.
+    """
+    from multiprocessing import resource_tracker
+
+    blocks = []
+    mapped_args = []
+    mapped_kwargs = {}
+
+    def attach(value):
+        value = decode_shared(value)
+        if not isinstance(value, SharedArray):
+            return value
+        shm, array = attach_array(value)
+        if shm is not None:
+            if unregister:
+                resource_tracker.unregister(shm._name, 'shared_memory')
+            blocks.append((shm, array))
+        return array
+
+    try:
+        mapped_args.extend(attach(value) for value in args)
+        mapped_kwargs.update((key, attach(value)) for key, value in kwargs.items())
+        yield mapped_args, mapped_kwargs
+    finally:
+        mapped_args.clear()
+        mapped_kwargs.clear()
+        while blocks:
+            shm, array = blocks.pop()
+            # numpy does not pin the buffer, unmapping it under a live view would crash
+            if sys.getrefcount(array) > 2:
+                _retained.append((shm, array))
+            else:
+                del array
+                shm.close()
+
+
+def _publish_mesh(mesh):
+    """Moves the arrays of a ``gmsh_api.Mesh`` into shared memory, returns its description.
+
+    The blocks stay registered with the resource tracker this process shares
+    with its parent: the parent unlinks them once copied, and blocks it never
+    received are reclaimed when it exits.
+    """
+
+    def share(array):
+        shm, shared = share_array(array)
+        if shm is not None:
+            shm.close()
+        return encode_shared(shared)
+
+    return {
+        'node_tags': share(mesh.node_tags),
+        'coords': share(mesh.coords),
+        'blocks': [
+            (etype, mesh.element_types[etype], share(mesh.element_tags[etype]), share(connectivity))
+            for etype, connectivity in mesh.connectivity.items()
+        ],
+        'groups': [(name, dim, share(tags)) for name, (dim, tags) in mesh.groups.items()],
+    }
+
+
+def _receive_mesh(payload):
+    """Rebuilds a ``gmsh_api.Mesh`` published by ``_publish_mesh``, releasing its shared memory."""
+    import numpy as np
+    from multiprocessing import shared_memory
+    from ._vendor.gmsh_api import Mesh
+
+    def receive(shared):
+        shared = decode_shared(shared)
+        if shared.name is None:
+            return np.empty(shared.shape, dtype=shared.dtype)
+        shm = shared_memory.SharedMemory(name=shared.name)
+        try:
+            return np.ndarray(shared.shape, dtype=shared.dtype, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    element_tags = {}
+    connectivity = {}
+    element_types = {}
+    for etype, props, tags, nodes in payload['blocks']:
+        element_types[etype] = tuple(props)
+        element_tags[etype] = receive(tags)
+        connectivity[etype] = receive(nodes)
+    groups = {name: (dim, receive(tags)) for name, dim, tags in payload['groups']}
+    return Mesh(receive(payload['node_tags']), receive(payload['coords']),
+                element_tags, connectivity, element_types, groups)
+
+
+def _discard_mesh(payload):
+    """Unlinks the shared memory of a mesh published by ``_publish_mesh`` without reading it."""
+    from multiprocessing import shared_memory
+
+    arrays = [payload['node_tags'], payload['coords']]
+    arrays.extend(shared for _, _, tags, nodes in payload['blocks'] for shared in (tags, nodes))
+    arrays.extend(tags for _, _, tags in payload['groups'])
+    for shared in map(decode_shared, arrays):
+        if shared.name is None:
+            continue
+        try:
+            shm = shared_memory.SharedMemory(name=shared.name)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+
+
+def _run(function, args, kwargs, messages, publish):
+    """Child process entry point: runs one pipeline function, posting its stages.
+
+    Array arguments arrive from ``SharedInputs`` and are used in place. The
+    node and element counts are sent back, or with ``publish`` set the
+    generated mesh itself, through shared memory as well.
+    """
+    from . import pipeline, tracing
+
+    def progress(stage):
+        messages.put(('stage', stage))
+
+    try:
+        with attached(args, kwargs) as (args, kwargs):
+            result = tracing.call(getattr(pipeline, function), *args, progress=progress,
+                                  return_mesh=publish, **kwargs)
+        messages.put(('done', _publish_mesh(result) if publish else result))
+    except Exception as e:
+        messages.put(('error', str(e)))
+
+
+class MeshJob():
+    """Runs ``pipeline.<function>(*args, **kwargs)`` in a child process.
+
+    Gmsh cannot be interrupted from another thread of the same process, so
+    the job gets a process of its own: cancelling terminates it, a Gmsh crash
+    does not take Blender down and the meshing memory is returned to the
+    system once the job ends. Array arguments are handed over through shared
+    memory instead of being pickled. Only the node and element counts come
+    back as ``result``, unless ``keep_mesh`` is set: the generated mesh is
+    then copied into this process as ``mesh``, through shared memory too. A
+    process that dies without reporting is started again up to
+    ``MAX_RESTARTS`` times. ``poll`` must be called periodically to collect
+    the stages the child reports.
+    """
+
+    def __init__(self, function, *args, keep_mesh=False, **kwargs):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.keep_mesh = keep_mesh
+        self.stage = None
+        self.error = None
+        self.result = None
+        self.mesh = None
+        self.finished = False
+        self.cancelled = False
+        self.restarts = 0
+        self.started = None
+        self.elapsed = 0.0
+        self._process = None
+        self._messages = None
+        self._inputs = None
+
+    def start(self):
+        self._inputs = SharedInputs(self.args, self.kwargs)
+        self.started = time.perf_counter()
+        self._spawn()
+        return self
+
+    def _spawn(self):
+        context = multiprocessing.get_context('spawn')
+        self._messages = context.Queue()
+        self._process = context.Process(
+            target=importable(_run),
+            args=(self.function, self._inputs.args, self._inputs.kwargs, self._messages, self.keep_mesh),
+            name='blendmsh-mesh',
+            daemon=True,
+        )
+        with spawning():
+            self._process.start()
+
+    def poll(self):
+        """Collects pending messages from the child, returns True once the job has finished."""
+        if self.finished:
+            return True
+        self.elapsed = time.perf_counter() - self.started
+        # Checked before draining, so a child that exited has flushed its last message
+        alive = self._process.is_alive()
+        while True:
+            try:
+                kind, value = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'stage':
+                self.stage = value
+            elif kind == 'done':
+                if self.keep_mesh:
+                    self.mesh = _receive_mesh(value)
+                    value = {'n_nodes': self.mesh.n_nodes, 'n_elements': self.mesh.n_elements}
+                self.result = value
+                self._finish()
+                return True
+            else:
+                self.error = value
+                self._finish()
+                return True
+
+        if not alive:
+            exitcode = self._process.exitcode
+            if self.restarts < MAX_RESTARTS:
+                self._process.join()
+                self._messages.close()
+                self.restarts += 1
+                self.stage = None
+                self._spawn()
+            else:
+                self.error = f'Meshing process exited unexpectedly (code {exitcode}).'
+                self._finish()
+        return self.finished
+
+    def cancel(self):
+        """Stops the child process, dropping any partial result."""
+        if self.finished:
+            return
+        self._process.terminate()
+        self.cancelled = True
+        self._finish()
+
+    @property
+    def n_nodes(self):
+        return self.result['n_nodes'] if self.result else 0
+
+    @property
+    def n_elements(self):
+        return self.result['n_elements'] if self.result else 0
+
+    @property
+    def progress(self):
+        """Fraction of the pipeline stages started so far."""
+        from .pipeline import STAGES
+
+        if self.finished:
+            return 1.0
+        if self.stage not in STAGES:
+            return 0.0
+        return STAGES.index(self.stage) / len(STAGES)
+
+    def _drain(self):
+        """Reads the messages left after the job ended, unlinking a mesh published meanwhile."""
+        while True:
+            try:
+                kind, value = self._messages.get_nowait()
+            except queue.Empty:
+                return
+            if kind == 'done' and self.keep_mesh:
+                _discard_mesh(value)
+
+    def _finish(self):
+        self.finished = True
+        self.elapsed = time.perf_counter() - self.started
+        self._process.join()
+        # After a cancel the child may have published its mesh just before being stopped
+        self._drain()
+        self._messages.close()
+        self._inputs.release()
@@ -0,0 +1,63 @@
+import importlib
+import threading
+import time
+
+# Modules making up the meshing backend, in load order. Importing the
+# vendored gmsh module loads the Gmsh shared library.
+BACKEND_MODULES = (
+    ('numpy', 'numpy'),
+    ('pipeline', __package__ + '.pipeline'),
+    ('gmsh', __package__ + '._vendor.gmsh'),
+)
+
+# Stage name -> seconds spent, 'register' included once the add-on is enabled.
+timings = {}
+
+_lock = threading.Lock()
+_loaded = False
+_error = None
+
+
+def load_backend():
+    """Imports the meshing backend once and returns the per-stage load times.
+
+    Safe to call from any thread; concurrent callers wait for the first load.
+    A failed load is remembered and raised again on later calls.
+    """
+    global _loaded, _error
+    with _lock:
+        if _error is not None:
+            raise _error
+        if not _loaded:
+            try:
+                for stage, module in BACKEND_MODULES:
+                    start = time.perf_counter()
+                    importlib.import_module(module)
+                    timings[stage] = time.perf_counter() - start
+            except ImportError as e:
+                _error = e
+                raise
+            _loaded = True
+    return timings
+
+
+def is_loaded():
+    return _loaded
+
+
+def warm_up():
+    """Loads the meshing backend in a daemon thread, so the first operator call does not pay for it."""
+    def run():
+        try:
+            load_backend()
+        except ImportError as e:
+            print(f"Blendmsh backend warm-up failed: {e}")
+
+    thread = threading.Thread(target=run, name='blendmsh-warm-up', daemon=True)
+    thread.start()
+    return thread
+
+
+def format_timings():
+    """Formats the recorded load times in milliseconds, e.g. 'register 2.1 ms, numpy 80.4 ms'."""
+    return ', '.join(f'{stage} {1000 * seconds:.1f} ms' for stage, seconds in timings.items())
@@ -24,5 +24,19 @@ class BLENDMSH_PT_Panel(bpy.types.Panel):
         layout.prop(scene.blendmsh, "cl_max", text="Element Size")
         layout.prop(scene.blendmsh, "mesh_dimension", text="Mesh Dimension")
         layout.prop(scene.blendmsh, 'output_file_format', text="Output Format")
+        layout.prop(scene.blendmsh, 'save_bundle', text="Save Mesh Bundle")
+        layout.prop(scene.blendmsh, 'import_result', text="Import Result")
+        layout.prop(scene.blendmsh, 'transfer_mode', text="Transfer")
+        if scene.blendmsh.transfer_mode == 'STL':
+            layout.prop(scene.blendmsh, 'weld_tolerance', text="Weld Tolerance")
 
-        layout.operator('blendmsh.meshproc', text='Generate Mesh')
+        from . import jobs
+        job = jobs.current
+        if job is not None and not job.finished:
+            layout.progress(factor=job.progress, type='BAR', text=f"{job.stage or 'Starting'} ({job.elapsed:.0f}s)")
+            layout.operator('blendmsh.meshcancel', icon='CANCEL', text='Cancel')
+        else:
+            layout.operator('blendmsh.meshproc', text='Generate Mesh')
+            row = layout.row(align=True)
+            row.operator('blendmsh.meshbatch', text='Mesh Selected').source = 'SELECTED'
+            row.operator('blendmsh.meshbatch', text='Mesh Collection').source = 'COLLECTION'
@@ -0,0 +1,259 @@
+import contextlib
+import math
+import numpy as np
+
+# Angle thresholds used to split the input triangulation into patches that
+# Gmsh can reparametrize with a single map each.
+CLASSIFY_ANGLE = 40.0
+CURVE_ANGLE = 180.0
+
+# Stages reported through the ``progress`` callback of the meshing functions,
+# in order. Volume meshing is skipped for 2D meshes.
+STAGES = (
+    'Loading geometry',
+    'Classifying surfaces',
+    'Meshing curves',
+    'Meshing surfaces',
+    'Meshing volumes',
+    'Writing',
+    'Saving bundle',
+)
+MESH_STAGES = {1: STAGES[2], 2: STAGES[3], 3: STAGES[4]}
+
+
+def _no_progress(stage):
+    pass
+
+
+def load_gmsh():
+    """Returns the vendorized gmsh module."""
+    from ._vendor import gmsh
+    return gmsh
+
+
+@contextlib.contextmanager
+def session():
+    """Yields the gmsh module, ready for one meshing run.
+
+    Gmsh is initialized for the run and finalized afterwards, unless it is
+    already initialized, as in the warm workers of ``daemon``. The models are
+    then cleared and the options restored instead, so no state leaks from one
+    run into the next.
+    """
+    gmsh = load_gmsh()
+    if not gmsh.isInitialized():
+        gmsh.initialize(interruptible=False)
+        try:
+            yield gmsh
+        finally:
+            gmsh.finalize()
+        return
+
+    gmsh.clear()
+    gmsh.option.restoreDefaults()
+    # Set by initialize() on top of the defaults
+    gmsh.option.setNumber('General.AbortOnError', 2)
+    gmsh.option.setNumber('General.Terminal', 1)
+    try:
+        yield gmsh
+    finally:
+        gmsh.clear()
+
+
+def add_surface_arrays(gmsh, nodes, triangles):
+    """Adds a discrete surface holding the given nodes and triangles.
+
+    ``nodes`` is an ``(N, 3)`` coordinate array and ``triangles`` an ``(M, 3)``
+    array of 0-based node indices. Both are handed to Gmsh as contiguous
+    buffers, so the vendored ``_ivector*`` helpers pass them straight through.
+    """
+    tag = gmsh.model.addDiscreteEntity(2)
+
+    node_tags = np.arange(1, len(nodes) + 1, dtype=np.uintp)
+    coords = np.ascontiguousarray(nodes, dtype=np.float64).reshape(-1)
+    gmsh.model.mesh.addNodes(2, tag, node_tags, coords)
+
+    element_nodes = np.asarray(triangles).reshape(-1).astype(np.uintp)
+    element_nodes += 1
+    gmsh.model.mesh.addElementsByType(tag, 2, [], element_nodes)
+    return tag
+
+
+def add_surface_groups(gmsh, nodes, triangles, groups):
+    """Adds one discrete surface per distinct value of ``groups``.
+
+    ``groups`` holds one integer per triangle (e.g. its material index). The
+    triangles are sorted by group once and split into contiguous blocks, each
+    added with a single ``addElementsByType`` call. Element tags follow the
+    sorted order, so the returned ``(ids, offsets)`` map any element tag ``t``
+    with ``offsets[i] < t <= offsets[i + 1]`` back to group ``ids[i]``.
+    """
+    order = np.argsort(groups, kind='stable')
+    ids, counts = np.unique(np.asarray(groups)[order], return_counts=True)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    element_nodes = np.asarray(triangles)[order].astype(np.uintp)
+    element_nodes += 1
+    element_tags = np.arange(1, len(order) + 1, dtype=np.uintp)
+
+    node_tags = np.arange(1, len(nodes) + 1, dtype=np.uintp)
+    coords = np.ascontiguousarray(nodes, dtype=np.float64).reshape(-1)
+
+    blocks = zip(np.split(element_tags, offsets[1:-1]), np.split(element_nodes, offsets[1:-1]))
+    for i, (tags, block) in enumerate(blocks):
+        tag = gmsh.model.addDiscreteEntity(2)
+        if i == 0:
+            gmsh.model.mesh.addNodes(2, tag, node_tags, coords)
+        gmsh.model.mesh.addElementsByType(tag, 2, tags, block.reshape(-1))
+    return ids, offsets
+
+
+def _group_name(ids, names, group):
+    index = int(ids[group])
+    return names[index] if index < len(names) else f'GROUP_{index}'
+
+
+def assign_physical_groups(gmsh, ids, offsets, names):
+    """Creates a physical group per input group on the classified surfaces.
+
+    Classification keeps the original element tags, so every surface is
+    traced back to the input group it was carved from. ``build_geometry``
+    keeps the group borders as curves, so a surface only ever holds elements
+    of one group.
+    """
+    members = {}
+    for _, tag in gmsh.model.getEntities(2):
+        element_tags, _ = gmsh.model.mesh.getElementsByType(2, tag)
+        if len(element_tags) == 0:
+            continue
+        group = np.searchsorted(offsets, element_tags[0], side='left') - 1
+        members.setdefault(int(group), []).append(tag)
+
+    for group, tags in sorted(members.items()):
+        gmsh.model.addPhysicalGroup(2, tags, name=_group_name(ids, names, group))
+
+
+def build_geometry(gmsh, angle=CLASSIFY_ANGLE, curve_angle=CURVE_ANGLE, topology=False):
+    """Reparametrizes the discrete surface mesh so it can be remeshed.
+
+    With ``topology`` set, the borders between the discrete surfaces become
+    curves first, so classification never merges two of them even where they
+    meet on a flat or smooth face.
+    """
+    if topology:
+        gmsh.model.mesh.createTopology()
+    gmsh.model.mesh.classifySurfaces(math.radians(angle), True, True, math.radians(curve_angle))
+    gmsh.model.mesh.createGeometry()
+
+
+def add_volume(gmsh):
+    """Closes all surfaces of the current model into a single volume."""
+    surfaces = gmsh.model.getEntities(2)
+    loop = gmsh.model.geo.addSurfaceLoop([s[1] for s in surfaces])
+    volume = gmsh.model.geo.addVolume([loop])
+    gmsh.model.geo.synchronize()
+    return volume
+
+
+def configure(gmsh, cl_max, element_order, algorithm):
+    """Applies the Blendmsh meshing parameters as Gmsh options."""
+    gmsh.option.setNumber('Mesh.CharacteristicLengthMax', cl_max)
+    gmsh.option.setNumber('Mesh.ElementOrder', int(element_order))
+    if int(algorithm):
+        gmsh.option.setNumber('Mesh.Algorithm', int(algorithm))
+
+
+def mesh_counts(gmsh):
+    """Returns the node and element counts of the current mesh.
+
+    Unlike building a ``gmsh_api.Mesh``, only the arrays of one element type
+    are alive at a time.
+    """
+    n_nodes = len(gmsh.model.mesh.getNodes(returnParametricCoord=False)[0])
+    n_elements = sum(len(gmsh.model.mesh.getElementsByType(etype)[0])
+                     for etype in gmsh.model.mesh.getElementTypes())
+    return {'n_nodes': n_nodes, 'n_elements': n_elements}
+
+
+def mesh_model(gmsh, output_file, cl_max, element_order, mesh_dimension, algorithm,
+               groups=None, group_names=(), bundle=True, progress=None, return_mesh=False):
+    """Remeshes the discrete surfaces of the current model and writes the result.
+
+    Reparametrization, volume creation and meshing all run inside Gmsh.
+    ``output_file`` may also be a list of paths, one per output format. When
+    ``groups`` is the ``(ids, offsets)`` pair returned by
+    ``add_surface_groups``, every group becomes a named physical surface.
+    With ``bundle`` set, the mesh is also saved as a memory-mappable bundle
+    next to the (first) output file. ``progress`` is called with each entry of
+    ``STAGES`` as it starts; curves, surfaces and volumes are meshed one
+    dimension at a time so each gets its own stage. Returns the node and
+    element counts from ``mesh_counts``, or with ``return_mesh`` set the
+    generated mesh as a ``gmsh_api.Mesh``.
+    """
+    progress = progress or _no_progress
+    progress('Classifying surfaces')
+    build_geometry(gmsh, topology=groups is not None)
+    if groups is not None:
+        assign_physical_groups(gmsh, *groups, group_names)
+
+    dimension = int(mesh_dimension)
+    if dimension == 3:
+        volume = add_volume(gmsh)
+        if groups is not None:
+            # Only elements in physical groups are saved once any group exists
+            gmsh.model.addPhysicalGroup(3, [volume], name='VOLUME')
+
+    configure(gmsh, cl_max, element_order, algorithm)
+    for dim in range(1, dimension + 1):
+        progress(MESH_STAGES[dim])
+        gmsh.model.mesh.generate(dim)
+    progress('Writing')
+    outputs = [output_file] if isinstance(output_file, str) else list(output_file)
+    for path in outputs:
+        gmsh.write(path)
+
+    mesh = None
+    if bundle or return_mesh:
+        from ._vendor.gmsh_api import Mesh
+        mesh = Mesh.from_gmsh(gmsh)
+    if bundle:
+        progress('Saving bundle')
+        from .bundle import bundle_path, save_bundle
+        save_bundle(bundle_path(outputs[0]), mesh)
+    if return_mesh:
+        return mesh
+    del mesh
+    return mesh_counts(gmsh)
+
+
+def mesh_arrays(nodes, triangles, output_file, cl_max, element_order, mesh_dimension, algorithm,
+                groups=None, group_names=(), bundle=True, progress=None, return_mesh=False):
+    """Meshes a triangulated surface held in memory and writes the result.
+
+    ``groups`` optionally assigns an integer group to each triangle; each one
+    is exported as a physical group named after ``group_names[group]``.
+    """
+    with session() as gmsh:
+        gmsh.model.add('blendmsh')
+        if progress is not None:
+            progress('Loading geometry')
+        if groups is None:
+            add_surface_arrays(gmsh, nodes, triangles)
+            physical = None
+        else:
+            physical = add_surface_groups(gmsh, nodes, triangles, groups)
+        return mesh_model(gmsh, output_file, cl_max, element_order, mesh_dimension, algorithm,
+                          groups=physical, group_names=group_names, bundle=bundle, progress=progress,
+                          return_mesh=return_mesh)
+
+
+def mesh_file(path, output_file, cl_max, element_order, mesh_dimension, algorithm, bundle=True,
+              progress=None, return_mesh=False):
+    """Meshes an STL file read by Gmsh itself and writes the result."""
+    with session() as gmsh:
+        gmsh.model.add('blendmsh')
+        if progress is not None:
+            progress('Loading geometry')
+        gmsh.merge(path)
+        return mesh_model(gmsh, output_file, cl_max, element_order, mesh_dimension, algorithm, bundle=bundle,
+                          progress=progress, return_mesh=return_mesh)
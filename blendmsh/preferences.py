@@ -1,16 +1,71 @@
 import bpy
-import importlib
+
+def _redraw_when_checked():
+    # Polled from a timer: the check thread must not touch the UI itself
+    from . import health
+    if health.get_report() is None:
+        return 0.2
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'PREFERENCES':
+                area.tag_redraw()
+    return None
 
 class BlendmshPreferences(bpy.types.AddonPreferences):
     bl_idname = __package__
 
+    warm_up: bpy.props.BoolProperty(
+        name="Preload Meshing Backend",
+        description="Load numpy and Gmsh in a background thread after startup instead of on first use",
+        default=False
+    )
+
+    use_daemon: bpy.props.BoolProperty(
+        name="Use Meshing Daemon",
+        description="Send meshing jobs to a persistent local worker daemon that keeps Gmsh loaded",
+        default=False
+    )
+
+    daemon_workers: bpy.props.IntProperty(
+        name="Daemon Workers",
+        description="Number of meshes the daemon generates concurrently, used when it is started",
+        default=1,
+        min=1,
+        max=64
+    )
+
+    trace_gmsh: bpy.props.BoolProperty(
+        name="Trace Gmsh Calls",
+        description="Write a table and a Chrome trace of the Gmsh API calls next to every generated mesh",
+        default=False
+    )
+
     def draw(self, context):
         layout = self.layout
+        layout.prop(self, 'warm_up')
+        layout.prop(self, 'use_daemon')
+        if self.use_daemon:
+            layout.prop(self, 'daemon_workers')
+        layout.prop(self, 'trace_gmsh')
+
+        from . import health, loader
+        if loader.timings:
+            layout.label(text=f'Load times: {loader.format_timings()}')
+
+        # Only display the cached report, the check itself runs in the background
+        report = health.get_report()
+        if report is None:
+            health.start_check()
+            if not bpy.app.timers.is_registered(_redraw_when_checked):
+                bpy.app.timers.register(_redraw_when_checked, first_interval=0.2)
+            layout.label(text='Checking dependencies...', icon='TIME')
+            return
 
-        try:
-            import pygmsh
-            self.report({'INFO'}, f'Vendorized pygmsh loaded successfully.')
-            return {'FINISHED'}
-        except ImportError as e:
-            self.report({'ERROR'}, 'Failed to load pygmsh from _vendor. Ensure the vendorized library is installed correctly.')
-            return {'CANCELLED'}
+        box = layout.box()
+        box.label(text=f"numpy: {report['numpy'] or 'missing'}")
+        box.label(text=f"Gmsh API: {report['gmsh_api'] or 'missing'}")
+        box.label(text=f"Gmsh library: {report['gmsh_library'] or 'not found'}")
+        for problem in report['problems']:
+            box.label(text=problem, icon='ERROR')
+        if not report['problems']:
+            box.label(text='All dependencies available.', icon='CHECKMARK')
@@ -1,7 +1,5 @@
 import bpy
 import os
-from collections import OrderedDict
-import pygmsh
 
 class BLENDMSH_OT_Physicalgroups(bpy.types.Operator):
     bl_idname = "blendmsh.physicalgroups"
@@ -53,7 +51,7 @@ class BLENDMSH_OT_Physicalgroups(bpy.types.Operator):
 class BLENDMSH_OT_Meshinit(bpy.types.Operator):
     bl_idname = 'blendmsh.meshinit'
     bl_label = 'Initialize Mesh'
-    bl_description = 'Triangulates the active object and prepares it for meshing.'
+    bl_description = 'Reads the triangulated active object and prepares it for meshing.'
 
     def execute(self, context):
         scene = context.scene
@@ -71,98 +69,384 @@ class BLENDMSH_OT_Meshinit(bpy.types.Operator):
             if context.space_data.type == 'VIEW_3D':
                 context.space_data.shading.type = 'MATERIAL'
 
-            filename = active_object.name + '.stl'
-            filepath = os.path.join(scene.blendmsh.workspace_path, filename)
-
-            bpy.ops.wm.stl_export(filepath=filepath, ascii_format=True)
+            from . import cache
 
-            if not os.path.exists(filepath):
-                self.report({'ERROR'}, f"Failed to export '{filename}' to '{scene.blendmsh.workspace_path}'.")
+            # Read the evaluated, triangulated mesh without touching the object itself
+            nodes, triangles, _ = cache.get_arrays(active_object, context.evaluated_depsgraph_get())
+            if len(triangles) == 0:
+                self.report({'ERROR'}, f'{active_object.name} has no faces to mesh.')
                 return {'CANCELLED'}
 
-            bpy.ops.object.select_all(action='DESELECT')
-            active_object.select_set(True)
-            bpy.ops.object.delete()
+            if scene.blendmsh.transfer_mode != 'MEMORY':
+                from .stl import write_binary
 
-            bpy.ops.wm.stl_import(filepath=filepath)
-            new_object = context.active_object
+                filename = active_object.name + '.stl'
+                filepath = os.path.join(scene.blendmsh.workspace_path, filename)
+                write_binary(filepath, nodes, triangles)
 
-            if new_object is None or new_object.type != 'MESH':
-                self.report({'ERROR'}, 'Failed to re-import the STL file.')
-                return {'CANCELLED'}
-
-            native_mat = bpy.data.materials.get('NATIVE')
-            if native_mat is None:
-                native_mat = bpy.data.materials.new(name='NATIVE')
-            new_object.data.materials.append(native_mat)
+            if 'NATIVE' not in active_object.data.materials:
+                native_mat = bpy.data.materials.get('NATIVE')
+                if native_mat is None:
+                    native_mat = bpy.data.materials.new(name='NATIVE')
+                active_object.data.materials.append(native_mat)
 
             scene.blendmsh.initialized = True
-            self.report({'INFO'}, f'Mesh initialized for {new_object.name}.')
+            self.report({'INFO'}, f'Mesh initialized for {active_object.name} ({len(triangles)} triangles).')
             return {'FINISHED'}
         except Exception as e:
             self.report({'ERROR'}, f'Failed to initialize mesh: {str(e)}.')
             return {'CANCELLED'}
 
 
-class BLENDMSH_OT_Meshproc(bpy.types.Operator):
+def load_backend(operator):
+    """Loads numpy and Gmsh on first use, reporting how long it took on ``operator``."""
+    from . import loader
+
+    if not loader.is_loaded():
+        loader.load_backend()
+        operator.report({'INFO'}, f'Meshing backend loaded ({loader.format_timings()}).')
+
+
+def apply_trace_preference(context):
+    """Turns the tracing of pipeline runs on or off for the meshing processes started next.
+
+    A daemon already running keeps the setting it was started with.
+    """
+    from .tracing import TRACE_ENV
+
+    if context.preferences.addons[__package__].preferences.trace_gmsh:
+        os.environ[TRACE_ENV] = '1'
+    else:
+        os.environ.pop(TRACE_ENV, None)
+
+
+def mesh_parameters(scene, obj):
+    """Returns the pipeline keyword arguments for meshing ``obj`` with the scene settings."""
+    filename = obj.name + '.stl'
+    return dict(
+        output_file=os.path.join(scene.blendmsh.workspace_path, filename + scene.blendmsh.output_file_format),
+        cl_max=scene.blendmsh.cl_max,
+        element_order=scene.blendmsh.element_order,
+        mesh_dimension=scene.blendmsh.mesh_dimension,
+        algorithm=scene.blendmsh.algorithm,
+        bundle=scene.blendmsh.save_bundle,
+    )
+
+
+def memory_job(scene, obj, depsgraph):
+    """Returns the ``(pipeline function, args, kwargs)`` meshing ``obj`` from its in-memory arrays.
+
+    Returns None when the object has no faces.
+    """
+    from . import cache
+    from .geometry import material_groups
+
+    nodes, triangles, materials = cache.get_arrays(obj, depsgraph)
+    if len(triangles) == 0:
+        return None
+
+    parameters = mesh_parameters(scene, obj)
+    # Faces assigned to GROUP_n materials become physical groups
+    groups, group_names = material_groups(obj, materials)
+    if groups is not None:
+        parameters['groups'] = groups
+        parameters['group_names'] = group_names
+    return 'mesh_arrays', (nodes, triangles), parameters
+
+
+def add_result_object(context, name, mesh):
+    """Links the triangles of a generated ``gmsh_api.Mesh`` into the scene as a new mesh object.
+
+    The coordinates are already in world space, as the meshed arrays were.
+    """
+    import numpy as np
+    from .geometry import surface_triangles
+
+    nodes, triangles = surface_triangles(mesh)
+    data = bpy.data.meshes.new(name)
+    data.vertices.add(len(nodes))
+    data.vertices.foreach_set('co', nodes.astype(np.float32).reshape(-1))
+    data.loops.add(triangles.size)
+    data.loops.foreach_set('vertex_index', triangles.reshape(-1))
+    data.polygons.add(len(triangles))
+    data.polygons.foreach_set('loop_start', np.arange(0, triangles.size, 3, dtype=np.int32))
+    data.update()
+
+    obj = bpy.data.objects.new(name, data)
+    context.collection.objects.link(obj)
+    return obj
+
+
+class JobPolling():
+    """Modal polling shared by the operators running ``jobs.current`` in the background.
+
+    ``start_polling`` is returned from ``invoke`` once the job has started;
+    ``finish(context, job)`` reports the outcome once it has finished and
+    returns the operator result.
+    """
+
+    _timer = None
+
+    def busy(self):
+        """Reports an error and returns True while another job is running."""
+        from . import jobs
+
+        if jobs.current is not None and not jobs.current.finished:
+            self.report({'ERROR'}, 'A mesh is already being generated.')
+            return True
+        return False
+
+    def start_polling(self, context):
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.25, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        from . import jobs
+
+        # Every other event belongs to the rest of Blender, the panel's Cancel
+        # button stops the job
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        job = jobs.current
+        finished = job.poll()
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        if not finished:
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self._timer)
+        self._timer = None
+        return self.finish(context, job)
+
+
+class BLENDMSH_OT_Meshproc(JobPolling, bpy.types.Operator):
     bl_idname = 'blendmsh.meshproc'
     bl_label = 'Process Mesh'
-    bl_description = 'Processes the mesh and generates the finite element mesh using pygmsh.'
+    bl_description = 'Processes the mesh and generates the finite element mesh using Gmsh.'
+
+    _result_name = None
 
     def execute(self, context):
+        """Meshes synchronously, used when the operator is called from scripts."""
+        job = self.prepare(context)
+        if job is None:
+            return {'CANCELLED'}
+
+        try:
+            from . import pipeline, tracing
+
+            function, args, kwargs = job
+            import_result = context.scene.blendmsh.import_result
+            result = tracing.call(getattr(pipeline, function), *args, return_mesh=import_result, **kwargs)
+            if import_result:
+                add_result_object(context, context.active_object.name + '_mesh', result)
+            self.report({'INFO'}, f"Mesh written to {kwargs['output_file']}.")
+            return {'FINISHED'}
+        except Exception as e:
+            self.report({'ERROR'}, f'Error processing mesh: {str(e)}.')
+            return {'CANCELLED'}
+
+    def invoke(self, context, event):
+        """Meshes in a background process, polled from a timer so the UI stays responsive."""
+        from . import jobs
+
+        if self.busy():
+            return {'CANCELLED'}
+
+        job = self.prepare(context)
+        if job is None:
+            return {'CANCELLED'}
+
+        function, args, kwargs = job
+        import_result = context.scene.blendmsh.import_result
+        preferences = context.preferences.addons[__package__].preferences
+        try:
+            if preferences.use_daemon:
+                from . import daemon
+
+                if not daemon.SUPPORTED:
+                    self.report({'ERROR'}, 'The meshing daemon needs Unix sockets, not available on this platform.')
+                    return {'CANCELLED'}
+                if import_result:
+                    self.report({'WARNING'}, 'The meshing daemon only returns counts, the result will not be imported.')
+                daemon.start_daemon(workers=preferences.daemon_workers)
+                jobs.current = daemon.DaemonJob(function, *args, **kwargs).start()
+            else:
+                jobs.current = jobs.MeshJob(function, *args, keep_mesh=import_result, **kwargs).start()
+        except Exception as e:
+            self.report({'ERROR'}, f'Could not start the meshing process: {str(e)}.')
+            return {'CANCELLED'}
+
+        self._result_name = context.active_object.name + '_mesh'
+        return self.start_polling(context)
+
+    def finish(self, context, job):
+        if job.cancelled:
+            self.report({'WARNING'}, 'Mesh generation cancelled.')
+            return {'CANCELLED'}
+        if job.error is not None:
+            self.report({'ERROR'}, f'Error processing mesh: {job.error}.')
+            return {'CANCELLED'}
+        if job.mesh is not None:
+            add_result_object(context, self._result_name, job.mesh)
+        self.report({'INFO'}, (
+            f"Mesh written to {job.kwargs['output_file']} ({job.n_nodes} nodes, "
+            f"{job.n_elements} elements) in {job.elapsed:.1f}s."
+        ))
+        return {'FINISHED'}
+
+    def prepare(self, context):
+        """Returns the ``(pipeline function, args, kwargs)`` meshing the active object.
+
+        Errors are reported on the operator and None is returned instead.
+        """
         scene = context.scene
         active_object = context.active_object
 
         if not scene.blendmsh.initialized:
             self.report({'ERROR'}, 'Mesh has not been initialized.')
-            return {'CANCELLED'}
+            return None
+
+        if active_object is None or active_object.type != 'MESH':
+            self.report({'ERROR'}, 'No active mesh object found.')
+            return None
+
+        filename = active_object.name + '.stl'
+        parameters = mesh_parameters(scene, active_object)
 
         try:
-            from .. import pygmsh
+            load_backend(self)
+            apply_trace_preference(context)
 
-            filename = active_object.name + '.stl'
-            filepath = os.path.join(scene.blendmsh.workspace_path, filename)
+            if scene.blendmsh.transfer_mode == 'MEMORY':
+                job = memory_job(scene, active_object, context.evaluated_depsgraph_get())
+                if job is None:
+                    self.report({'ERROR'}, f'{active_object.name} has no faces to mesh.')
+                return job
 
+            filepath = os.path.join(scene.blendmsh.workspace_path, filename)
             if not os.path.exists(filepath):
                 self.report({'ERROR'}, f'STL file "{filepath}" not found.')
-                return {'CANCELLED'}
-
-            geom = pygmsh.geo.Geometry()
-            with open(filepath, 'r') as f:
-                stl_content = f.read()
+                return None
 
-            # Process the STL mesh and generate the Gmsh mesh
-            geom.add_stl(stl_content, lcar=scene.blendmsh.cl_max)
+            if scene.blendmsh.transfer_mode == 'GMSH':
+                return 'mesh_file', (filepath,), parameters
 
-            mesh = pygmsh.generate_mesh(geom, verbose=True, geo_filename=filepath)
-            output_file = os.path.join(scene.blendmsh.workspace_path, filename + scene.blendmsh.output_file_format)
+            from .geometry import weld_vertices
 
-            mesh.write(output_file)
+            # STL facets do not share vertices, weld them before handing them to Gmsh
+            facets = self.get_raw_data(filepath)
+            nodes, triangles, weld = weld_vertices(facets, scene.blendmsh.weld_tolerance)
+            self.report({'INFO'}, (
+                f"Welded {weld['input_vertices']} vertices into {weld['output_vertices']} "
+                f"({weld['weld_ratio']:.1f}x) in {weld['time']:.3f}s."
+            ))
+            return 'mesh_arrays', (nodes, triangles), parameters
 
-            self.report({'INFO'}, f'Mesh written to {output_file}.')
-            return {'FINISHED'}
-
-        except ImportError:
-            self.report({'ERROR'}, 'Could not import pygmsh. Please ensure it is installed.')
-            return {'CANCELLED'}
+        except ImportError as e:
+            self.report({'ERROR'}, f'Could not load the meshing backend: {str(e)}.')
+            return None
         except Exception as e:
             self.report({'ERROR'}, f'Error processing mesh: {str(e)}.')
-            return {'CANCELLED'}
+            return None
 
     @staticmethod
-    def get_raw_data(path):
-        """Extracts raw vertex data from an STL file."""
-        data = []
+    def get_raw_data(path, parallel=None):
+        """Extracts raw vertex data from an STL file as an (N, 3, 3) array.
+
+        Large ASCII files are parsed across a process pool unless ``parallel``
+        is given explicitly.
+        """
         try:
-            with open(path, 'r') as file:
-                current_tri = []
-                for line in file:
-                    if 'vertex' in line:
-                        vertex = tuple(map(float, line.strip().split()[1:]))
-                        current_tri.append(vertex)
-                    if 'endfacet' in line:
-                        data.append(tuple(current_tri))
-                        current_tri = []
-            return data
+            from .stl import read_stl
+            return read_stl(path, parallel=parallel)
         except Exception as e:
             raise IOError(f"Error reading STL file: {e}")
+
+
+class BLENDMSH_OT_Meshcancel(bpy.types.Operator):
+    bl_idname = 'blendmsh.meshcancel'
+    bl_label = 'Cancel Mesh'
+    bl_description = 'Stops the mesh being generated in the background.'
+
+    def execute(self, context):
+        from . import jobs
+
+        if jobs.current is None or jobs.current.finished:
+            self.report({'ERROR'}, 'No mesh is being generated.')
+            return {'CANCELLED'}
+
+        # The modal operator notices on its next timer tick and reports the cancellation
+        jobs.current.cancel()
+        return {'FINISHED'}
+
+
+class BLENDMSH_OT_Meshbatch(JobPolling, bpy.types.Operator):
+    bl_idname = 'blendmsh.meshbatch'
+    bl_label = 'Batch Mesh'
+    bl_description = 'Meshes every selected object, or every object of the active collection, in parallel.'
+
+    source: bpy.props.EnumProperty(
+        name="Objects",
+        items=[
+            ('SELECTED', "Selected", "Mesh the selected objects"),
+            ('COLLECTION', "Collection", "Mesh every object of the active collection"),
+        ],
+        default='SELECTED'
+    )
+
+    def invoke(self, context, event):
+        from . import jobs
+        from .batch import Batch
+
+        if self.busy():
+            return {'CANCELLED'}
+
+        if self.source == 'COLLECTION':
+            objects = context.collection.all_objects
+        else:
+            objects = context.selected_objects
+        objects = [obj for obj in objects if obj.type == 'MESH']
+        if not objects:
+            self.report({'ERROR'}, 'No mesh objects to process.')
+            return {'CANCELLED'}
+
+        try:
+            load_backend(self)
+            apply_trace_preference(context)
+            depsgraph = context.evaluated_depsgraph_get()
+            tasks = []
+            for obj in objects:
+                job = memory_job(context.scene, obj, depsgraph)
+                if job is None:
+                    self.report({'WARNING'}, f'{obj.name} has no faces to mesh, skipped.')
+                    continue
+                tasks.append((obj.name,) + job)
+            if not tasks:
+                self.report({'ERROR'}, 'None of the objects has faces to mesh.')
+                return {'CANCELLED'}
+            jobs.current = Batch(tasks).start()
+        except ImportError as e:
+            self.report({'ERROR'}, f'Could not load the meshing backend: {str(e)}.')
+            return {'CANCELLED'}
+        except Exception as e:
+            self.report({'ERROR'}, f'Could not start the batch: {str(e)}.')
+            return {'CANCELLED'}
+
+        return self.start_polling(context)
+
+    def finish(self, context, batch):
+        summary = batch.summary()
+        for line in summary[:len(batch.results)]:
+            self.report({'INFO'}, line)
+        for name, error in batch.errors.items():
+            self.report({'ERROR'}, f'{name}: {error}.')
+        if batch.cancelled:
+            self.report({'WARNING'}, 'Batch cancelled. ' + summary[-1])
+            return {'CANCELLED'}
+        self.report({'INFO'}, summary[-1])
+        return {'FINISHED'}
@@ -45,6 +45,37 @@ class BlendmshProperties(bpy.types.PropertyGroup):
         default='0'
     )
 
+    weld_tolerance: FloatProperty(
+        name="Weld Tolerance",
+        default=1e-6,
+        min=1e-9,
+        max=1.0,
+        precision=6,
+        description="Distance below which STL vertices are merged before meshing."
+    )
+
+    transfer_mode: EnumProperty(
+        name='Transfer',
+        items=[
+            ('MEMORY', 'In Memory', 'Hand vertex and triangle arrays directly to Gmsh'),
+            ('STL', 'STL File', 'Read the exported STL file with NumPy and weld it before meshing'),
+            ('GMSH', 'STL File (Gmsh)', 'Let Gmsh read the exported STL file itself')],
+        default='MEMORY',
+        description='How the geometry is handed over to Gmsh'
+    )
+
+    save_bundle: BoolProperty(
+        name="Save Mesh Bundle",
+        default=True,
+        description="Also save the mesh as raw arrays that can be reopened without parsing"
+    )
+
+    import_result: BoolProperty(
+        name="Import Result",
+        default=False,
+        description="Add the surface of the generated mesh to the scene as a new object"
+    )
+
     output_file_format : EnumProperty(
                 name='Output',
                 items=[
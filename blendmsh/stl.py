@@ -0,0 +1,225 @@
+import multiprocessing
+import os
+import string
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+from .jobs import importable, spawning
+
+HEADER_SIZE = 80
+
+# Bytes read per step when streaming ASCII files.
+CHUNK_SIZE = 16 * 1024 * 1024
+
+# ASCII files at least this large are parsed across a process pool by default.
+PARALLEL_MIN_SIZE = 256 * 1024 * 1024
+
+# Blanks out every keyword letter except 'e', which may belong to an exponent.
+# The 'e's left over from 'facet', 'vertex', 'outer' and 'endloop' end up
+# isolated between blanks and are removed in a second pass.
+_KEYWORD_LETTERS = (string.ascii_letters.replace('e', '').replace('E', '') + '\r\n\t').encode('ascii')
+_KEYWORD_TABLE = bytes.maketrans(_KEYWORD_LETTERS, b' ' * len(_KEYWORD_LETTERS))
+
+# One binary STL facet record: normal, three vertices and the attribute count.
+FACET_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attribute', '<u2'),
+])
+
+
+def is_binary(path):
+    """Checks whether an STL file is binary by matching its size to the facet count."""
+    size = os.path.getsize(path)
+    if size < HEADER_SIZE + 4:
+        return False
+    with open(path, 'rb') as file:
+        file.seek(HEADER_SIZE)
+        count = int(np.frombuffer(file.read(4), dtype='<u4')[0])
+    return size == HEADER_SIZE + 4 + count * FACET_DTYPE.itemsize
+
+
+def read_binary(path):
+    """Memory-maps a binary STL file as an ``(N, 3, 3)`` float32 view."""
+    with open(path, 'rb') as file:
+        file.seek(HEADER_SIZE)
+        count = int(np.frombuffer(file.read(4), dtype='<u4')[0])
+    if count == 0:
+        return np.empty((0, 3, 3), dtype=np.float32)
+    facets = np.memmap(path, dtype=FACET_DTYPE, mode='r', offset=HEADER_SIZE + 4, shape=(count,))
+    return facets['vertices']
+
+
+def parse_ascii_block(data):
+    """Converts complete ASCII facets into an ``(N, 3, 3)`` float32 array.
+
+    ``data`` must start before a ``facet`` keyword and end right after an
+    ``endfacet`` keyword. Numbers are converted in bulk by NumPy; the facet
+    normals are parsed along with the vertices and dropped afterwards.
+    """
+    data = data.translate(_KEYWORD_TABLE).replace(b' e ', b'   ').rstrip(b'e ')
+    values = np.fromstring(data, dtype=np.float32, sep=' ')
+    if values.size % 12:
+        raise ValueError('Malformed ASCII STL facet block.')
+    return values.reshape(-1, 4, 3)[:, 1:]
+
+
+def iter_ascii(path, chunk_size=CHUNK_SIZE):
+    """Streams an ASCII STL file as blocks of ``(N, 3, 3)`` float32 triangles.
+
+    At most one chunk plus one partial facet is held in memory at a time.
+    """
+    with open(path, 'rb') as file:
+        # Skip the 'solid <name>' header line
+        file.readline()
+        tail = b''
+        while True:
+            chunk = file.read(chunk_size)
+            buffer = tail + chunk
+            end = buffer.rfind(b'endfacet')
+            if end >= 0:
+                end += len(b'endfacet')
+                yield parse_ascii_block(buffer[:end])
+                buffer = buffer[end:]
+            if not chunk:
+                break
+            tail = buffer
+
+
+def read_ascii(path, chunk_size=CHUNK_SIZE):
+    """Parses an ASCII STL file into an ``(N, 3, 3)`` float32 array."""
+    blocks = list(iter_ascii(path, chunk_size))
+    if not blocks:
+        return np.empty((0, 3, 3), dtype=np.float32)
+    return np.concatenate(blocks)
+
+
+def _next_facet_end(file, offset):
+    """Returns the offset right after the first 'endfacet' at or past ``offset``."""
+    file.seek(offset)
+    carry = b''
+    base = offset
+    while True:
+        chunk = file.read(64 * 1024)
+        if not chunk:
+            return base + len(carry)
+        data = carry + chunk
+        found = data.find(b'endfacet')
+        if found >= 0:
+            return base + found + len(b'endfacet')
+        carry = data[-(len(b'endfacet') - 1):]
+        base += len(data) - len(carry)
+
+
+def facet_ranges(path, parts):
+    """Splits an ASCII STL file into byte ranges aligned on 'endfacet' boundaries."""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as file:
+        # Skip the 'solid <name>' header line
+        file.readline()
+        bounds = [file.tell()]
+        for i in range(1, parts):
+            offset = max(size * i // parts, bounds[-1])
+            if offset >= size:
+                break
+            bounds.append(_next_facet_end(file, offset))
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _parse_range(path, start, end):
+    """Parses one byte range in a worker and publishes it as shared memory."""
+    with open(path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    last = data.rfind(b'endfacet')
+    if last < 0:
+        return None, 0
+
+    triangles = parse_ascii_block(data[:last + len(b'endfacet')])
+    if len(triangles) == 0:
+        return None, 0
+
+    shm = shared_memory.SharedMemory(create=True, size=triangles.nbytes)
+    np.ndarray(triangles.shape, dtype=np.float32, buffer=shm.buf)[:] = triangles
+    shm.close()
+    # Stays registered with the resource tracker the worker shares with the
+    # parent: the parent unlinks it, or the tracker does if the parent dies
+    return shm.name, len(triangles)
+
+
+def read_ascii_parallel(path, max_workers=None, chunk_size=CHUNK_SIZE):
+    """Parses an ASCII STL file across a process pool.
+
+    The file is split into ranges of roughly ``chunk_size`` bytes. Each worker
+    hands its triangles back through a shared memory block, which is copied
+    into one contiguous ``(N, 3, 3)`` float32 array and released. The
+    workers are spawned rather than forked, as forking Blender's UI process
+    is unsafe.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    parts = max(workers, -(-os.path.getsize(path) // chunk_size))
+
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        with spawning():
+            futures = [executor.submit(importable(_parse_range), path, start, end)
+                       for start, end in facet_ranges(path, parts)]
+
+    # Leaving the pool waited for every range, so when one of them failed the
+    # blocks published by the others are still known and unlinked below
+    pending = {future.result()[0] for future in futures if future.exception() is None} - {None}
+    try:
+        results = [future.result() for future in futures]
+        total = sum(count for _, count in results)
+        triangles = np.empty((total, 3, 3), dtype=np.float32)
+        offset = 0
+        for name, count in results:
+            if name is None:
+                continue
+            shm = shared_memory.SharedMemory(name=name)
+            try:
+                triangles[offset:offset + count] = np.ndarray((count, 3, 3), dtype=np.float32, buffer=shm.buf)
+            finally:
+                shm.close()
+                shm.unlink()
+                pending.discard(name)
+            offset += count
+        return triangles
+    finally:
+        for name in pending:
+            shm = shared_memory.SharedMemory(name=name)
+            shm.close()
+            shm.unlink()
+
+
+def read_stl(path, parallel=None):
+    """Reads the triangles of an STL file, detecting binary or ASCII encoding.
+
+    ASCII files are parsed in parallel when ``parallel`` is set, or, if it is
+    left as None, when the file is at least ``PARALLEL_MIN_SIZE`` bytes.
+    """
+    if is_binary(path):
+        return read_binary(path)
+    if parallel is None:
+        parallel = os.path.getsize(path) >= PARALLEL_MIN_SIZE
+    if parallel:
+        return read_ascii_parallel(path)
+    return read_ascii(path)
+
+
+def write_binary(path, nodes, triangles):
+    """Writes ``(N, 3)`` nodes and ``(M, 3)`` 0-based triangles as a binary STL file."""
+    corners = np.asarray(nodes, dtype=np.float32)[np.asarray(triangles)]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    facets = np.zeros(len(corners), dtype=FACET_DTYPE)
+    facets['normal'] = normals
+    facets['vertices'] = corners
+
+    with open(path, 'wb') as file:
+        file.write(b'Binary STL written by Blendmsh'.ljust(HEADER_SIZE, b' '))
+        file.write(np.uint32(len(facets)).tobytes())
+        facets.tofile(file)
@@ -0,0 +1,213 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import numpy as np
+
+# Set to a value other than 0 to trace every pipeline run, see ``call``. The
+# meshing processes inherit it: background jobs, batch pools and daemon
+# workers (when the daemon is started).
+TRACE_ENV = 'BLENDMSH_TRACE'
+
+
+def _nbytes(value):
+    """Estimates the bytes held by an argument or result of a gmsh call."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(item) for item in value)
+    if isinstance(value, (int, float)):
+        return 8
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    return 0
+
+
+def _api_functions(owner, module_name):
+    """Yields ``(owner, attribute, raw attribute, function)`` for every public gmsh API function.
+
+    Walks the module and its nested API classes (``model``, ``model.mesh``, ...).
+    Snake-case aliases are yielded too, with the same underlying function.
+    """
+    for name, raw in list(vars(owner).items()):
+        if name.startswith('_'):
+            continue
+        function = raw.__func__ if isinstance(raw, staticmethod) else raw
+        if isinstance(function, type):
+            if function.__module__ == module_name:
+                yield from _api_functions(function, module_name)
+        elif callable(function) and getattr(function, '__module__', None) == module_name:
+            yield owner, name, raw, function
+
+
+class Tracer():
+    """Records call count, wall time and marshalled bytes of every gmsh API call.
+
+    The gmsh functions are only wrapped between ``start`` and ``stop`` (or
+    inside a ``with`` block), the module is left untouched otherwise::
+
+        with Tracer() as tracer:
+            mesh_arrays(nodes, triangles, ...)
+        print(tracer.table())
+        tracer.write_chrome_trace('blendmsh.trace.json')
+    """
+
+    def __init__(self, gmsh=None, events=True):
+        if gmsh is None:
+            from .pipeline import load_gmsh
+            gmsh = load_gmsh()
+        self.gmsh = gmsh
+        self.events = events
+        # qualified name -> [calls, seconds, bytes in, bytes out]
+        self.stats = {}
+        # (name, start, duration, thread) of every call, for the Chrome trace
+        self.calls = []
+        self._saved = []
+        self._origin = None
+
+    def _wrap(self, function):
+        name = function.__qualname__
+        stats = self.stats
+        calls = self.calls
+        events = self.events
+
+        @functools.wraps(function)
+        def traced(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                entry = stats.get(name)
+                if entry is None:
+                    entry = stats[name] = [0, 0.0, 0, 0]
+                entry[0] += 1
+                entry[1] += end - start
+                entry[2] += _nbytes(args) + _nbytes(tuple(kwargs.values()))
+                if events:
+                    calls.append((name, start, end - start, threading.get_ident()))
+            entry[3] += _nbytes(result)
+            return result
+        return traced
+
+    def start(self):
+        """Wraps every gmsh API function."""
+        if self._saved:
+            return self
+        if self._origin is None:
+            self._origin = time.perf_counter()
+        module_name = self.gmsh.__name__
+        wrappers = {}
+        for owner, name, raw, function in _api_functions(self.gmsh, module_name):
+            traced = wrappers.get(function)
+            if traced is None:
+                traced = wrappers[function] = self._wrap(function)
+            self._saved.append((owner, name, raw))
+            if owner is self.gmsh:
+                setattr(owner, name, traced)
+            else:
+                setattr(owner, name, staticmethod(traced))
+        return self
+
+    def stop(self):
+        """Restores the original gmsh API functions."""
+        for owner, name, raw in reversed(self._saved):
+            setattr(owner, name, raw)
+        self._saved = []
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def clear(self):
+        """Drops every recorded call."""
+        self.stats.clear()
+        self.calls.clear()
+        self._origin = time.perf_counter() if self._saved else None
+
+    def table(self, sort='time', limit=None):
+        """Formats the recorded calls as a text table, sorted by ``time``, ``calls``, ``in`` or ``out``."""
+        column = {'calls': 0, 'time': 1, 'in': 2, 'out': 3}[sort]
+        rows = sorted(self.stats.items(), key=lambda item: item[1][column], reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+        width = max([len('function')] + [len(name) for name, _ in rows])
+        lines = [f"{'function':<{width}} {'calls':>8} {'time (s)':>10} {'per call (ms)':>14} {'in (B)':>12} {'out (B)':>12}"]
+        for name, (calls, seconds, bytes_in, bytes_out) in rows:
+            lines.append(f'{name:<{width}} {calls:>8} {seconds:>10.4f} {1000 * seconds / calls:>14.4f} {bytes_in:>12} {bytes_out:>12}')
+        return '\n'.join(lines)
+
+    def chrome_trace(self):
+        """Returns the recorded calls in the Chrome trace event format."""
+        origin = self._origin or 0.0
+        pid = os.getpid()
+        return {
+            'traceEvents': [{
+                'name': name,
+                'cat': 'gmsh',
+                'ph': 'X',
+                'ts': (start - origin) * 1e6,
+                'dur': duration * 1e6,
+                'pid': pid,
+                'tid': thread,
+            } for name, start, duration, thread in self.calls],
+            'displayTimeUnit': 'ms',
+        }
+
+    def write_chrome_trace(self, path):
+        """Writes the recorded calls as a Chrome trace JSON file (chrome://tracing, Perfetto)."""
+        with open(path, 'w') as file:
+            json.dump(self.chrome_trace(), file)
+
+
+def enabled():
+    """Returns True when pipeline runs are traced in this process."""
+    return os.environ.get(TRACE_ENV, '0') != '0'
+
+
+def trace_files(output_file):
+    """Returns the ``(table, Chrome trace)`` paths written next to a generated mesh file."""
+    return output_file + '.trace.txt', output_file + '.trace.json'
+
+
+def copy_table(copy_stats):
+    """Formats the input copies recorded in ``gmsh.copy_stats`` as a text table, largest first."""
+    rows = sorted(copy_stats.items(), key=lambda item: item[1]['bytes'], reverse=True)
+    width = max([len('function')] + [len(name) for name, _ in rows])
+    lines = [f"{'function':<{width}} {'copied (B)':>12} {'lists':>8} {'casts':>8}"]
+    for name, entry in rows:
+        lines.append(f"{name:<{width}} {entry['bytes']:>12} {entry['lists']:>8} {entry['casts']:>8}")
+    return '\n'.join(lines)
+
+
+def call(function, *args, **kwargs):
+    """Calls a pipeline meshing function, traced when ``TRACE_ENV`` is set.
+
+    The call table and the input copies are written to a text file next to
+    the (first) output file, the calls to a Chrome trace; see ``trace_files``.
+    """
+    if not enabled():
+        return function(*args, **kwargs)
+
+    output_file = inspect.signature(function).bind(*args, **kwargs).arguments['output_file']
+    if not isinstance(output_file, str):
+        output_file = output_file[0]
+    tracer = Tracer()
+    gmsh = tracer.gmsh
+    gmsh.copy_stats = {}
+    try:
+        with tracer:
+            return function(*args, **kwargs)
+    finally:
+        copy_stats, gmsh.copy_stats = gmsh.copy_stats, None
+        table, trace = trace_files(output_file)
+        with open(table, 'w') as file:
+            file.write(tracer.table() + '\n')
+            if copy_stats:
+                file.write('\n' + copy_table(copy_stats) + '\n')
+        tracer.write_chrome_trace(trace)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The tests import the bpy-free modules of the add-on package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
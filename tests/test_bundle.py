@@ -0,0 +1,85 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from blendmsh import bundle
+from blendmsh._vendor.gmsh_api import Mesh
+
+
+def triangles(n_nodes, offset=0.0):
+    return Mesh(
+        node_tags=np.arange(1, n_nodes + 1, dtype=np.uint64),
+        coords=np.arange(n_nodes * 3, dtype=np.float64).reshape(-1, 3) + offset,
+        element_tags={2: np.array([1], dtype=np.uint64)},
+        connectivity={2: np.array([[1, 2, 3]], dtype=np.uint64)},
+        element_types={2: ('Triangle 3', 2, 1, 3)},
+    )
+
+
+def test_save_load_bundle(tmp_path):
+    mesh = Mesh(
+        node_tags=np.array([3, 5, 7, 9], dtype=np.uint64),
+        coords=np.arange(12, dtype=np.float64).reshape(4, 3),
+        element_tags={2: np.array([1, 2], dtype=np.uint64), 4: np.array([3], dtype=np.uint64),
+                      15: np.empty(0, dtype=np.uint64)},
+        connectivity={2: np.array([[3, 5, 7], [5, 9, 7]], dtype=np.uint64),
+                      4: np.array([[3, 5, 7, 9]], dtype=np.uint64), 15: np.empty((0, 1), dtype=np.uint64)},
+        element_types={2: ('Triangle 3', 2, 1, 3), 4: ('Tetrahedron 4', 3, 1, 4), 15: ('Point', 0, 1, 1)},
+        groups={'PATCH': (2, np.array([2], dtype=np.uint64)), 'VOLUME': (3, np.array([3], dtype=np.uint64))},
+    )
+    path = bundle.bundle_path(str(tmp_path / 'mesh.msh'))
+    bundle.save_bundle(path, mesh)
+    loaded = bundle.load_bundle(path)
+
+    assert isinstance(loaded.coords, np.memmap)
+    assert not loaded.coords.flags.writeable
+    np.testing.assert_array_equal(loaded.node_tags, mesh.node_tags)
+    np.testing.assert_array_equal(loaded.coords, mesh.coords)
+    assert loaded.element_types == mesh.element_types
+    for etype in mesh.connectivity:
+        assert loaded.connectivity[etype].dtype == mesh.connectivity[etype].dtype
+        np.testing.assert_array_equal(loaded.element_tags[etype], mesh.element_tags[etype])
+        np.testing.assert_array_equal(loaded.connectivity[etype], mesh.connectivity[etype])
+    assert {name: (dim, tags.tolist()) for name, (dim, tags) in loaded.groups.items()} == {
+        'PATCH': (2, [2]), 'VOLUME': (3, [3]),
+    }
+    np.testing.assert_array_equal(loaded.nidxs[2], [[0, 1, 2], [1, 3, 2]])
+
+
+def test_load_bundle_version(tmp_path):
+    path = str(tmp_path / 'mesh.msh.blendmsh')
+    bundle.save_bundle(path, triangles(3))
+    header = os.path.join(path, bundle.HEADER_NAME)
+    with open(header) as file:
+        content = json.load(file)
+    content['version'] = bundle.BUNDLE_VERSION + 1
+    with open(header, 'w') as file:
+        json.dump(content, file)
+    with pytest.raises(ValueError, match='version'):
+        bundle.load_bundle(path)
+
+
+def test_save_bundle_over_mapped_bundle(tmp_path):
+    path = str(tmp_path / 'mesh.msh.blendmsh')
+    bundle.save_bundle(path, triangles(1000))
+    mapped = bundle.load_bundle(path)
+
+    # Meshing again to the same output, with a smaller mesh
+    bundle.save_bundle(path, triangles(3, offset=0.5))
+    assert mapped.coords[-1, 2] == 2999
+    assert bundle.load_bundle(path).coords.tolist() == (np.arange(9).reshape(3, 3) + 0.5).tolist()
+    assert os.listdir(tmp_path) == ['mesh.msh.blendmsh']
+
+
+def test_save_bundle_failure_keeps_previous(tmp_path):
+    path = str(tmp_path / 'mesh.msh.blendmsh')
+    bundle.save_bundle(path, triangles(3))
+
+    broken = triangles(4)
+    broken.element_types = {}
+    with pytest.raises(KeyError):
+        bundle.save_bundle(path, broken)
+    assert bundle.load_bundle(path).n_nodes == 3
+    assert os.listdir(tmp_path) == ['mesh.msh.blendmsh']
@@ -0,0 +1,63 @@
+import json
+import os
+
+import pytest
+
+from blendmsh import cli
+
+
+def write_manifest(tmp_path, manifest):
+    path = tmp_path / 'manifest.json'
+    path.write_text(json.dumps(manifest))
+    return str(path)
+
+
+def test_load_manifest(tmp_path):
+    path = write_manifest(tmp_path, {
+        'workspace': 'out',
+        'workers': 3,
+        'defaults': {'cl_max': 0.2, 'formats': '.vtk'},
+        'jobs': [
+            {'object': 'Bracket', 'cl_max': 0.05},
+            {'stl': 'parts/housing.stl', 'formats': ['.msh', '.inp']},
+            {'stl': 'parts/housing.stl', 'name': 'housing_fine', 'mesh_dimension': 2},
+        ],
+    })
+    jobs, workers, results, workspace = cli.load_manifest(path)
+
+    assert workers == 3
+    assert workspace == str(tmp_path / 'out')
+    assert results == str(tmp_path / 'results.json')
+    assert [job['name'] for job in jobs] == ['Bracket', 'housing', 'housing_fine']
+
+    bracket, housing, fine = jobs
+    assert bracket['cl_max'] == 0.05
+    assert bracket['outputs'] == [os.path.join(workspace, 'Bracket.stl.vtk')]
+    assert housing['stl'] == str(tmp_path / 'parts' / 'housing.stl')
+    assert housing['cl_max'] == 0.2
+    assert housing['outputs'] == [os.path.join(workspace, 'housing.stl' + fmt) for fmt in ('.msh', '.inp')]
+    assert fine['mesh_dimension'] == 2
+    assert fine['element_order'] == cli.DEFAULTS['element_order']
+
+
+def test_load_manifest_duplicate_names(tmp_path):
+    path = write_manifest(tmp_path, {'jobs': [
+        {'object': 'Part'},
+        {'stl': 'a/Part.stl'},
+        {'stl': 'b/other.stl', 'name': 'Other'},
+        {'object': 'Other'},
+    ]})
+    with pytest.raises(ValueError, match='Other, Part'):
+        cli.load_manifest(path)
+
+
+def test_load_manifest_missing_source(tmp_path):
+    path = write_manifest(tmp_path, {'jobs': [{'object': 'Part'}, {'name': 'nothing', 'cl_max': 0.1}]})
+    with pytest.raises(ValueError, match='Job 1 has neither'):
+        cli.load_manifest(path)
+
+
+def test_load_manifest_empty(tmp_path):
+    jobs, workers, _, workspace = cli.load_manifest(write_manifest(tmp_path, {}))
+    assert jobs == [] and workers is None
+    assert workspace == str(tmp_path)
@@ -0,0 +1,63 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from blendmsh import daemon
+
+pytestmark = pytest.mark.skipif(not daemon.SUPPORTED, reason='Unix sockets not available')
+
+
+def connect(path, timeout=30):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return daemon.Client(path)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+@pytest.fixture
+def running(tmp_path):
+    path = str(tmp_path / 'daemon.sock')
+    thread = threading.Thread(target=daemon.Daemon(path, workers=1).serve_forever, daemon=True)
+    thread.start()
+    client = connect(path)
+    yield path, client
+    client.shutdown()
+    client.close()
+    thread.join(timeout=30)
+
+
+def test_submit_rejects_unknown_function(running):
+    _, client = running
+    with pytest.raises(ValueError, match='unknown function'):
+        client.submit('load_gmsh')
+    with pytest.raises(ValueError, match='unknown function'):
+        client.submit(['mesh_arrays'])
+    assert client.status()['queued'] == 0
+
+
+def test_serve_refuses_live_daemon(running):
+    path, client = running
+    with pytest.raises(RuntimeError, match='already running'):
+        daemon.Daemon(path, workers=1).serve_forever()
+    assert client.status()['status'] == 'daemon'
+
+
+def test_serve_replaces_stale_socket(tmp_path):
+    path = str(tmp_path / 'daemon.sock')
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    thread = threading.Thread(target=daemon.Daemon(path, workers=1).serve_forever, daemon=True)
+    thread.start()
+    client = connect(path)
+    assert client.status()['status'] == 'daemon'
+    client.shutdown()
+    client.close()
+    thread.join(timeout=30)
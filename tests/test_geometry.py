@@ -0,0 +1,61 @@
+import numpy as np
+
+from blendmsh import geometry
+from blendmsh._vendor.gmsh_api import Mesh
+
+
+def test_surface_triangles():
+    # A second order triangle next to a line, node 9 is not used by any triangle
+    mesh = Mesh(
+        node_tags=np.array([2, 4, 6, 8, 9, 10, 12], dtype=np.uint64),
+        coords=np.arange(21, dtype=np.float64).reshape(7, 3),
+        element_tags={9: np.array([1], dtype=np.uint64), 1: np.array([2], dtype=np.uint64)},
+        connectivity={9: np.array([[4, 8, 12, 6, 10, 2]], dtype=np.uint64), 1: np.array([[9, 4]], dtype=np.uint64)},
+        element_types={9: ('Triangle 6', 2, 2, 6), 1: ('Line 2', 1, 1, 2)},
+    )
+    nodes, triangles = geometry.surface_triangles(mesh)
+    assert triangles.dtype == np.int32
+    np.testing.assert_array_equal(nodes[triangles], mesh.coords[[[1, 3, 6]]])
+    assert len(nodes) == 3
+
+
+def test_weld_vertices_tolerance():
+    # Two triangles sharing an edge, the shared corners off by less than the tolerance
+    facets = np.array([
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+        [[1.0002, 0, 0], [1, 1, 0], [0, 1.0003, 0]],
+    ])
+    nodes, triangles, stats = geometry.weld_vertices(facets, 1e-3)
+    assert len(nodes) == 4
+    assert triangles[0, 1] == triangles[1, 0] and triangles[0, 2] == triangles[1, 2]
+    assert stats['input_vertices'] == 6 and stats['output_vertices'] == 4
+    assert stats['weld_ratio'] == 1.5
+
+    # The same corners stay apart with a finer tolerance
+    nodes, triangles, stats = geometry.weld_vertices(facets, 1e-5)
+    assert len(nodes) == 6
+    assert stats['collapsed_triangles'] == 0
+
+
+def test_weld_vertices_collapsed():
+    # The second triangle shrinks to an edge once welded
+    facets = np.array([
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+        [[0, 0, 0], [1e-4, 0, 0], [0, 1, 0]],
+    ])
+    nodes, triangles, stats = geometry.weld_vertices(facets, 1e-3)
+    assert len(triangles) == 1
+    assert stats['collapsed_triangles'] == 1
+    np.testing.assert_array_equal(nodes[triangles[0]], facets[0])
+
+
+def test_weld_vertices_wide_lattice():
+    # Too many lattice cells to pack into int64 keys, rows are compared instead
+    facets = np.array([
+        [[0, 0, 0], [1e4, 0, 0], [0, 1e4, 0]],
+        [[1e4 + 2e-4, 0, 0], [1e4, 1e4, 0], [0, 1e4 - 2e-4, 0]],
+    ])
+    assert geometry._lattice_keys(facets.reshape(-1, 3), 1e-3)[0] is None
+    nodes, triangles, stats = geometry.weld_vertices(facets, 1e-3)
+    assert len(nodes) == 4
+    assert triangles[0, 1] == triangles[1, 0] and triangles[0, 2] == triangles[1, 2]
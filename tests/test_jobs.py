@@ -0,0 +1,84 @@
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from blendmsh import jobs, pipeline
+from blendmsh._vendor.gmsh_api import Mesh
+
+from test_pipeline import grid
+
+
+def sample_mesh():
+    return Mesh(
+        node_tags=np.arange(1, 5, dtype=np.uint64),
+        coords=np.arange(12, dtype=np.float64).reshape(4, 3),
+        element_tags={2: np.array([7, 8], dtype=np.uint64), 15: np.empty(0, dtype=np.uint64)},
+        connectivity={2: np.array([[1, 2, 3], [3, 2, 4]], dtype=np.uint64), 15: np.empty((0, 1), dtype=np.uint64)},
+        element_types={2: ('Triangle 3', 2, 1, 3), 15: ('Point', 0, 1, 1)},
+        groups={'PATCH': (2, np.array([8], dtype=np.uint64))},
+    )
+
+
+def shared_names(payload):
+    arrays = [payload['node_tags'], payload['coords']]
+    arrays.extend(shared for _, _, tags, nodes in payload['blocks'] for shared in (tags, nodes))
+    arrays.extend(tags for _, _, tags in payload['groups'])
+    return [name for name, _, _ in (jobs.decode_shared(shared) for shared in arrays) if name is not None]
+
+
+def unlinked(names):
+    for name in names:
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        return False
+    return True
+
+
+def test_publish_receive_mesh():
+    mesh = sample_mesh()
+    payload = jobs._publish_mesh(mesh)
+    names = shared_names(payload)
+    assert len(names) == 5
+
+    received = jobs._receive_mesh(payload)
+    assert unlinked(names)
+    np.testing.assert_array_equal(received.node_tags, mesh.node_tags)
+    np.testing.assert_array_equal(received.coords, mesh.coords)
+    assert received.element_types == mesh.element_types
+    for etype in mesh.connectivity:
+        np.testing.assert_array_equal(received.element_tags[etype], mesh.element_tags[etype])
+        np.testing.assert_array_equal(received.connectivity[etype], mesh.connectivity[etype])
+    dim, tags = received.groups['PATCH']
+    assert dim == 2 and tags.tolist() == [8]
+
+
+def test_discard_mesh():
+    payload = jobs._publish_mesh(sample_mesh())
+    names = shared_names(payload)
+    jobs._discard_mesh(payload)
+    assert unlinked(names)
+
+
+def test_mesh_job_keep_mesh(tmp_path):
+    if pipeline.load_gmsh().libpath is None:
+        pytest.skip('Gmsh shared library not available')
+
+    nodes, triangles = grid(4)
+    kwargs = dict(cl_max=0.5, element_order=1, mesh_dimension=2, algorithm=0, bundle=False)
+    counts = jobs.MeshJob('mesh_arrays', nodes, triangles, str(tmp_path / 'counts.msh'), **kwargs).start()
+    kept = jobs.MeshJob('mesh_arrays', nodes, triangles, str(tmp_path / 'kept.msh'), keep_mesh=True, **kwargs).start()
+    deadline = time.monotonic() + 60
+    while not (counts.poll() and kept.poll()):
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+    assert counts.error is None and kept.error is None
+    assert counts.mesh is None
+    assert kept.result == counts.result
+    assert (kept.mesh.n_nodes, kept.mesh.n_elements) == (counts.n_nodes, counts.n_elements)
+    assert kept.mesh.coords[:, 2].max() == 0
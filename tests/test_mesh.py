@@ -0,0 +1,43 @@
+import numpy as np
+
+from blendmsh._vendor.gmsh_api import Mesh
+
+
+def neighbours(mesh, dim=None):
+    indptr, indices = mesh.element_to_element(dim)
+    return [sorted(indices[indptr[i]:indptr[i + 1]].tolist()) for i in range(len(indptr) - 1)]
+
+
+def triangles(connectivity, n_nodes):
+    connectivity = np.asarray(connectivity, dtype=np.uint64)
+    return Mesh(
+        node_tags=np.arange(1, n_nodes + 1, dtype=np.uint64),
+        coords=np.zeros((n_nodes, 3)),
+        element_tags={2: np.arange(1, len(connectivity) + 1, dtype=np.uint64)},
+        connectivity={2: connectivity},
+        element_types={2: ('Triangle 3', 2, 1, 3)},
+    )
+
+
+def test_element_to_element_manifold():
+    # Two triangles sharing the edge 2-3
+    mesh = triangles([[1, 2, 3], [3, 2, 4]], 4)
+    assert neighbours(mesh) == [[1], [0]]
+
+
+def test_element_to_element_non_manifold_edge():
+    # Three triangles fanning out of the edge 1-2
+    mesh = triangles([[1, 2, 3], [1, 2, 4], [2, 1, 5]], 5)
+    assert neighbours(mesh) == [[1, 2], [0, 2], [0, 1]]
+
+
+def test_element_to_element_branching_lines():
+    # Three lines meeting at node 1, a fourth one continuing the first
+    mesh = Mesh(
+        node_tags=np.arange(1, 6, dtype=np.uint64),
+        coords=np.zeros((5, 3)),
+        element_tags={1: np.arange(1, 5, dtype=np.uint64)},
+        connectivity={1: np.array([[1, 2], [3, 1], [1, 4], [2, 5]], dtype=np.uint64)},
+        element_types={1: ('Line 2', 1, 1, 2)},
+    )
+    assert neighbours(mesh) == [[1, 2, 3], [0, 2], [0, 1], [0]]
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from blendmsh import pipeline
+
+
+class FakeGmsh():
+    """Just enough of the gmsh API for assign_physical_groups."""
+
+    def __init__(self, surfaces):
+        self.surfaces = surfaces
+        self.physical = []
+        self.model = SimpleNamespace(
+            getEntities=lambda dim: [(2, tag) for tag in surfaces],
+            addPhysicalGroup=lambda dim, tags, name: self.physical.append((dim, tags, name)),
+            mesh=SimpleNamespace(getElementsByType=lambda etype, tag: (np.array(surfaces[tag], dtype=np.uint64), [])),
+        )
+
+
+def grid(n):
+    """An n x n grid of unit squares in the z = 0 plane, two triangles each."""
+    x, y = np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij')
+    nodes = np.column_stack((x.ravel(), y.ravel(), np.zeros(x.size))).astype(np.float64)
+    corner = (np.arange(n)[:, None] * (n + 1) + np.arange(n)[None, :]).ravel()
+    triangles = np.concatenate((
+        np.column_stack((corner, corner + n + 1, corner + n + 2)),
+        np.column_stack((corner, corner + n + 2, corner + 1)),
+    ))
+    return nodes, triangles
+
+
+def test_assign_physical_groups():
+    # Group 0 holds element tags 1-3, group 1 tags 4-5, split into two surfaces each
+    gmsh = FakeGmsh({1: [1, 2], 2: [4], 3: [3], 4: [5]})
+    pipeline.assign_physical_groups(gmsh, np.array([0, 1]), np.array([0, 3, 5]), ['NATIVE', 'GROUP_1'])
+    assert gmsh.physical == [(2, [1, 3], 'NATIVE'), (2, [2, 4], 'GROUP_1')]
+
+
+def test_mesh_arrays_flat_patch(tmp_path):
+    if pipeline.load_gmsh().libpath is None:
+        pytest.skip('Gmsh shared library not available')
+
+    # A patch painted in the middle of a flat grid keeps its own surface
+    nodes, triangles = grid(4)
+    centroids = nodes[triangles].mean(axis=1)
+    patch = (np.abs(centroids[:, :2] - 2) < 1).all(axis=1)
+    mesh = pipeline.mesh_arrays(
+        nodes, triangles, str(tmp_path / 'patch.msh'), cl_max=0.5, element_order=1, mesh_dimension=2,
+        algorithm=0, groups=patch.astype(np.int32), group_names=['NATIVE', 'PATCH'], bundle=False,
+        return_mesh=True,
+    )
+
+    assert set(mesh.groups) == {'NATIVE', 'PATCH'}
+    _, tags = mesh.groups['PATCH']
+    assert len(tags)
+    rows = np.searchsorted(mesh.element_tags[2], tags)
+    inside = mesh.coords[mesh.nidxs[2][rows]].mean(axis=1)[:, :2]
+    assert (np.abs(inside - 2) <= 1 + 1e-9).all()
+
+
+def test_mesh_counts(tmp_path):
+    if pipeline.load_gmsh().libpath is None:
+        pytest.skip('Gmsh shared library not available')
+
+    nodes, triangles = grid(4)
+    kwargs = dict(cl_max=0.5, element_order=2, mesh_dimension=2, algorithm=0, bundle=False)
+    counts = pipeline.mesh_arrays(nodes, triangles, str(tmp_path / 'counts.msh'), **kwargs)
+    mesh = pipeline.mesh_arrays(nodes, triangles, str(tmp_path / 'mesh.msh'), return_mesh=True, **kwargs)
+    assert counts == {'n_nodes': mesh.n_nodes, 'n_elements': mesh.n_elements}
@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+import pytest
+
+from blendmsh import stl
+
+
+def ascii_stl(facets, name='part', newline='\n', fmt='{:.6e}'):
+    lines = [f'solid {name}']
+    for facet in facets:
+        lines.append('  facet normal ' + ' '.join(fmt.format(v) for v in (0.0, 0.0, 1.0)))
+        lines.append('    outer loop')
+        lines.extend('      vertex ' + ' '.join(fmt.format(v) for v in vertex) for vertex in facet)
+        lines.append('    endloop')
+        lines.append('  endfacet')
+    lines.append(f'endsolid {name}')
+    return (newline.join(lines) + newline).encode('ascii')
+
+
+def random_facets(n, seed=0):
+    return np.random.default_rng(seed).uniform(-1e3, 1e3, (n, 3, 3)).astype(np.float32)
+
+
+def shared_blocks():
+    return set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+
+
+def test_parse_ascii_block_exponents():
+    data = (b'facet normal 0 0 1\nouter loop\n'
+            b'vertex 1.5e-3 -2E+02 1e5\nvertex .5 -0.25e1 3\nvertex 7 8.0E0 -9e-1\n'
+            b'endloop\nendfacet')
+    triangles = stl.parse_ascii_block(data)
+    expected = np.array([[[1.5e-3, -200, 1e5], [0.5, -2.5, 3], [7, 8, -0.9]]], dtype=np.float32)
+    np.testing.assert_array_equal(triangles, expected)
+
+
+def test_parse_ascii_block_malformed():
+    with pytest.raises(ValueError):
+        stl.parse_ascii_block(b'facet normal 0 0 1\nouter loop\nvertex 1 2 3\nvertex 4 5\nendloop\nendfacet')
+
+
+@pytest.mark.parametrize('name', ['part', 'Bracket 2 rev e5', ''])
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_read_ascii(tmp_path, name, newline):
+    facets = random_facets(50)
+    path = tmp_path / 'part.stl'
+    path.write_bytes(ascii_stl(facets, name, newline))
+    # Chunks smaller than a facet split every facet across reads
+    for chunk_size in (64, 1000, stl.CHUNK_SIZE):
+        np.testing.assert_allclose(stl.read_ascii(str(path), chunk_size), facets, rtol=1e-6)
+
+
+def test_read_ascii_empty(tmp_path):
+    path = tmp_path / 'empty.stl'
+    path.write_bytes(ascii_stl([]))
+    assert stl.read_ascii(str(path)).shape == (0, 3, 3)
+
+
+def test_facet_ranges(tmp_path):
+    path = tmp_path / 'part.stl'
+    data = ascii_stl(random_facets(100), newline='\r\n')
+    path.write_bytes(data)
+
+    ranges = stl.facet_ranges(str(path), 7)
+    assert len(ranges) == 7
+    assert ranges[0][0] == data.index(b'\n') + 1
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[:end].endswith(b'endfacet')
+
+    # More parts than facets
+    assert len(stl.facet_ranges(str(path), 1000)) <= 101
+
+
+def test_read_ascii_parallel(tmp_path):
+    facets = random_facets(300)
+    path = tmp_path / 'part.stl'
+    path.write_bytes(ascii_stl(facets))
+    triangles = stl.read_ascii_parallel(str(path), max_workers=2, chunk_size=4096)
+    np.testing.assert_array_equal(triangles, stl.read_ascii(str(path)))
+
+
+def test_read_ascii_parallel_malformed(tmp_path):
+    data = ascii_stl(random_facets(300))
+    # One vertex loses a coordinate in the middle of the file
+    start = data.index(b'vertex', len(data) // 2)
+    end = data.index(b'\n', start)
+    data = data[:start] + data[start:end].rsplit(b' ', 1)[0] + data[end:]
+    path = tmp_path / 'part.stl'
+    path.write_bytes(data)
+
+    before = shared_blocks()
+    with pytest.raises(ValueError):
+        stl.read_ascii_parallel(str(path), max_workers=2, chunk_size=4096)
+    assert shared_blocks() == before
@@ -0,0 +1,64 @@
+import json
+import time
+
+import pytest
+
+from blendmsh import jobs, pipeline, tracing
+
+from test_pipeline import grid
+
+
+@pytest.fixture
+def traced(monkeypatch):
+    if pipeline.load_gmsh().libpath is None:
+        pytest.skip('Gmsh shared library not available')
+    monkeypatch.setenv(tracing.TRACE_ENV, '1')
+
+
+def read_trace_files(output_file):
+    table, trace = tracing.trace_files(output_file)
+    with open(table) as file:
+        text = file.read()
+    with open(trace) as file:
+        names = {event['name'] for event in json.load(file)['traceEvents']}
+    return text, names
+
+
+def add_list_nodes(output_file):
+    with pipeline.session() as gmsh:
+        gmsh.model.add('lists')
+        tag = gmsh.model.addDiscreteEntity(2)
+        gmsh.model.mesh.addNodes(2, tag, [1, 2, 3], [0.0] * 9)
+        gmsh.write(output_file)
+
+
+def test_call_untraced(tmp_path, monkeypatch):
+    monkeypatch.delenv(tracing.TRACE_ENV, raising=False)
+    output_file = str(tmp_path / 'mesh.msh')
+    assert tracing.call(lambda output_file: 'result', output_file) == 'result'
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_call_traced(tmp_path, traced):
+    output_file = str(tmp_path / 'nodes.msh')
+    tracing.call(add_list_nodes, output_file)
+    text, names = read_trace_files(output_file)
+    calls, copies = text.split('copied (B)')
+    assert 'model.mesh.addNodes' in calls and 'model.mesh.addNodes' in copies
+    assert {'model.addDiscreteEntity', 'write'} <= names
+    assert pipeline.load_gmsh().copy_stats is None
+
+
+def test_mesh_job_traced(tmp_path, traced):
+    nodes, triangles = grid(2)
+    output_file = str(tmp_path / 'mesh.msh')
+    job = jobs.MeshJob('mesh_arrays', nodes, triangles, output_file, cl_max=0.5, element_order=1,
+                       mesh_dimension=2, algorithm=0, bundle=False).start()
+    deadline = time.monotonic() + 60
+    while not job.poll():
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    assert job.error is None
+    text, names = read_trace_files(output_file)
+    assert 'model.mesh.generate' in text
+    assert {'model.mesh.classifySurfaces', 'write'} <= names